@@ -3,107 +3,238 @@ Static Code Analysis for Terminal Explorer.
 Identifies potential bugs, vulnerabilities, and code quality issues.
 """
 
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import mmap
 import re
 import os
+import sys
+
+
+# One detected issue; a tuple layout is much smaller than a dict per issue
+Issue = namedtuple('Issue', 'file line severity type message code')
+
+# Shared string objects for the fields repeated across every issue
+SEV_HIGH = sys.intern('HIGH')
+SEV_MEDIUM = sys.intern('MEDIUM')
+SEV_LOW = sys.intern('LOW')
+TYPE_BARE_EXCEPT = sys.intern('Bare except clause')
+TYPE_SILENT_ERROR = sys.intern('Silent error handling')
+TYPE_SHELL_INJECTION = sys.intern('Security: shell injection risk')
+TYPE_OS_SYSTEM = sys.intern('Security: os.system usage')
+TYPE_PATH_TRAVERSAL = sys.intern('Potential path traversal')
+
+# All patterns in one alternation, so the whole file is scanned once in C.
+# Checks that need two tokens on the same line match each token separately,
+# and whitespace classes exclude newlines so no match spans two lines.
+# The text is matched as str so \b and \s follow Unicode rules.
+_RE_ALL = re.compile(
+    r'(?P<bare>except[^\S\n]*:)'
+    r'|(?P<except>except)'
+    r'|(?P<ossys>\bos\.system[^\S\n]*\()'
+    r'|(?P<subprocess>subprocess)'
+    r'|(?P<shell>shell=True)'
+    r'|(?P<join>os\.path\.join)'
+    r'|(?P<dotdot>\.\.)'
+)
+
+# Every check needs at least one of these substrings somewhere in the file;
+# they are looked up in the raw mapped bytes so files without them are never decoded
+_ANCHORS = (b'except', b'os.system', b'shell=True', b'os.path.join')
+
+# Results keyed on (path, mtime, size) so unchanged files are not rescanned
+_ANALYSIS_CACHE: dict[tuple[str, int, int], list] = {}
+
+# Below this many uncached files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+
+def _iter_hit_lines(buf):
+    """Yield ``(line_no, start, end, found)`` for every line with at least one pattern match.
+    
+    Match offsets are mapped back to lines by counting newlines incrementally,
+    so lines without matches are never sliced.
+    """
+    size = len(buf)
+    line_no = 1
+    counted = 0
+    start = end = -1
+    found = set()
+    for m in _RE_ALL.finditer(buf):
+        pos = m.start()
+        if pos > end:
+            if found:
+                yield line_no, start, end, found
+            start = buf.rfind('\n', 0, pos) + 1
+            end = buf.find('\n', pos)
+            if end < 0:
+                end = size
+            line_no += buf[counted:start].count('\n')
+            counted = start
+            found = set()
+        found.add(m.lastgroup)
+    if found:
+        yield line_no, start, end, found
+
+
+def _find_silent_pass(buf, end, line_no):
+    """Return the line number of a ``pass`` that directly follows an except header, if any."""
+    size = len(buf)
+    pos = end + 1
+    while pos < size:
+        line_no += 1
+        end = buf.find('\n', pos)
+        if end < 0:
+            end = size
+        stripped = buf[pos:end].strip()
+        if 'except' in stripped and ':' in stripped:
+            return None
+        if stripped == 'pass':
+            return line_no
+        if stripped and not stripped.startswith('#'):
+            return None
+        pos = end + 1
+    return None
+
+
+def _cache_key(filepath):
+    """Return the results-cache key for filepath's current contents."""
+    st = os.stat(filepath)
+    return (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+def _reintern(issues):
+    """Swap unpickled severity and type strings for the shared interned copies."""
+    return [
+        issue._replace(severity=sys.intern(issue.severity), type=sys.intern(issue.type))
+        for issue in issues
+    ]
 
 
 def analyze_code(filepath):
     """Analyze a Python file for potential issues."""
+    key = _cache_key(filepath)
+    cached = _ANALYSIS_CACHE.get(key)
+    if cached is not None:
+        return list(cached)
+    
     issues = []
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-        lines = content.split('\n')
-    
-    # Check for potential issues
-    
-    # 1. Bare except clauses (can hide bugs)
-    for i, line in enumerate(lines, 1):
-        if re.search(r'except\s*:', line):
-            issues.append({
-                'file': filepath,
-                'line': i,
-                'severity': 'MEDIUM',
-                'type': 'Bare except clause',
-                'message': 'Using bare except: can hide bugs. Consider catching specific exceptions.',
-                'code': line.strip()
-            })
-    
-    # 2. Pass in except blocks (silently ignoring errors)
-    in_except = False
-    except_line = 0
-    for i, line in enumerate(lines, 1):
-        if 'except' in line and ':' in line:
-            in_except = True
-            except_line = i
-        elif in_except and line.strip() == 'pass':
-            issues.append({
-                'file': filepath,
-                'line': i,
-                'severity': 'LOW',
-                'type': 'Silent error handling',
-                'message': 'Exception is silently ignored with pass. Consider logging or handling.',
-                'code': f"Line {except_line}: {lines[except_line-1].strip()} ... pass"
-            })
-            in_except = False
-        elif in_except and line.strip() and not line.strip().startswith('#'):
-            in_except = False
-    
-    # 3. Shell=True in subprocess (potential security issue)
-    for i, line in enumerate(lines, 1):
-        if 'subprocess' in line and 'shell=True' in line:
-            issues.append({
-                'file': filepath,
-                'line': i,
-                'severity': 'HIGH',
-                'type': 'Security: shell injection risk',
-                'message': 'Using shell=True in subprocess can lead to shell injection vulnerabilities.',
-                'code': line.strip()
-            })
-    
-    # 4. os.system calls (deprecated and insecure)
-    for i, line in enumerate(lines, 1):
-        if re.search(r'\bos\.system\s*\(', line):
-            issues.append({
-                'file': filepath,
-                'line': i,
-                'severity': 'HIGH',
-                'type': 'Security: os.system usage',
-                'message': 'os.system is deprecated and insecure. Use subprocess instead.',
-                'code': line.strip()
-            })
-    
-    # 5. Potential path traversal issues
-    for i, line in enumerate(lines, 1):
-        if 'os.path.join' in line and '..' in line:
-            issues.append({
-                'file': filepath,
-                'line': i,
-                'severity': 'MEDIUM',
-                'type': 'Potential path traversal',
-                'message': 'Path joining with ".." could lead to path traversal.',
-                'code': line.strip()
-            })
-    
-    # 6. Unchecked file operations
-    dangerous_ops = ['os.remove', 'shutil.rmtree', 'os.rmdir', 'os.unlink']
-    for i, line in enumerate(lines, 1):
-        for op in dangerous_ops:
-            if op in line and 'try:' not in lines[max(0, i-5):i]:
-                # Check if there's no try block nearby
-                # This is a heuristic, not perfect
-                pass  # We're actually handling these pretty well in the code
-    
-    # 7. Missing input validation
-    for i, line in enumerate(lines, 1):
-        if 'Input' in line and 'value' in line:
-            # Check if there's validation nearby
-            context = '\n'.join(lines[max(0, i-5):min(len(lines), i+5)])
-            if 'if' not in context and 'assert' not in context:
-                # This is just a heuristic
-                pass
-    
-    return issues
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if any(mm.find(anchor) >= 0 for anchor in _ANCHORS):
+                    _scan_buffer(filepath, _decode_source(mm), issues)
+    
+    # Silent-except issues are reported from their header, so restore line order
+    issues.sort(key=lambda issue: issue.line)
+    _ANALYSIS_CACHE[key] = issues
+    return list(issues)
+
+
+def _decode_source(buf):
+    """Decode a source buffer to str with universal newlines, as text-mode open() would."""
+    text = buf[:].decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _scan_buffer(filepath, buf, issues):
+    """Append the issues found in the decoded source ``buf`` to ``issues``."""
+    for i, start, end, found in _iter_hit_lines(buf):
+        pass_line = None
+        if ('bare' in found or 'except' in found) and buf.find(':', start, end) >= 0:
+            pass_line = _find_silent_pass(buf, end, i)
+        flagged = (
+            'bare' in found
+            or 'ossys' in found
+            or ('subprocess' in found and 'shell' in found)
+            or ('join' in found and 'dotdot' in found)
+        )
+        if pass_line is None and not flagged:
+            # Token hits that complete no check are never sliced
+            continue
+        stripped = buf[start:end].strip()
+        
+        # 1. Bare except clauses (can hide bugs)
+        if 'bare' in found:
+            issues.append(Issue(
+                file=filepath,
+                line=i,
+                severity=SEV_MEDIUM,
+                type=TYPE_BARE_EXCEPT,
+                message='Using bare except: can hide bugs. Consider catching specific exceptions.',
+                code=stripped
+            ))
+        
+        # 2. Pass in except blocks (silently ignoring errors)
+        if pass_line is not None:
+            issues.append(Issue(
+                file=filepath,
+                line=pass_line,
+                severity=SEV_LOW,
+                type=TYPE_SILENT_ERROR,
+                message='Exception is silently ignored with pass. Consider logging or handling.',
+                code=f"Line {i}: {stripped} ... pass"
+            ))
+        
+        # 3. Shell=True in subprocess (potential security issue)
+        if 'subprocess' in found and 'shell' in found:
+            issues.append(Issue(
+                file=filepath,
+                line=i,
+                severity=SEV_HIGH,
+                type=TYPE_SHELL_INJECTION,
+                message='Using shell=True in subprocess can lead to shell injection vulnerabilities.',
+                code=stripped
+            ))
+        
+        # 4. os.system calls (deprecated and insecure)
+        if 'ossys' in found:
+            issues.append(Issue(
+                file=filepath,
+                line=i,
+                severity=SEV_HIGH,
+                type=TYPE_OS_SYSTEM,
+                message='os.system is deprecated and insecure. Use subprocess instead.',
+                code=stripped
+            ))
+        
+        # 5. Potential path traversal issues
+        if 'join' in found and 'dotdot' in found:
+            issues.append(Issue(
+                file=filepath,
+                line=i,
+                severity=SEV_MEDIUM,
+                type=TYPE_PATH_TRAVERSAL,
+                message='Path joining with ".." could lead to path traversal.',
+                code=stripped
+            ))
+
+
+def analyze_files(filepaths):
+    """Analyze several files, returning one issue list per path in order.
+
+    Uncached files are spread over worker processes once there are at least
+    PARALLEL_MIN_FILES of them; their results are cached here in the parent.
+    """
+    keys = [_cache_key(filepath) for filepath in filepaths]
+    pending = [
+        (filepath, key) for filepath, key in zip(filepaths, keys)
+        if key not in _ANALYSIS_CACHE
+    ]
+    if len(pending) >= PARALLEL_MIN_FILES:
+        # Files are independent, so analyze them on separate processes
+        workers = min(len(pending), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(analyze_code, [filepath for filepath, _ in pending])
+            for (_, key), issues in zip(pending, results):
+                _ANALYSIS_CACHE[key] = _reintern(issues)
+    return [
+        list(_ANALYSIS_CACHE[key]) if key in _ANALYSIS_CACHE else analyze_code(filepath)
+        for filepath, key in zip(filepaths, keys)
+    ]
 
 
 def main():
@@ -117,58 +248,57 @@ def main():
         'clipboard_helpers.py',
     ]
     
-    all_issues = []
+    buckets = {SEV_HIGH: [], SEV_MEDIUM: [], SEV_LOW: []}
     
-    for filepath in files_to_analyze:
-        if os.path.exists(filepath):
-            print(f"\nAnalyzing {filepath}...")
-            issues = analyze_code(filepath)
-            all_issues.extend(issues)
-            print(f"  Found {len(issues)} potential issues")
+    existing = [filepath for filepath in files_to_analyze if os.path.exists(filepath)]
+    per_file = analyze_files(existing)
     
-    # Sort by severity
-    severity_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
-    all_issues.sort(key=lambda x: severity_order[x['severity']])
+    for filepath, issues in zip(existing, per_file):
+        print(f"\nAnalyzing {filepath}...")
+        for issue in issues:
+            buckets[issue.severity].append(issue)
+        print(f"  Found {len(issues)} potential issues")
     
     print("\n" + "="*60)
     print("ANALYSIS RESULTS")
     print("="*60)
     
-    if not all_issues:
+    total = sum(map(len, buckets.values()))
+    if not total:
         print("\n✓ No issues found!")
         print("\nThe code follows good practices and has proper error handling.")
         return 0
     
-    # Group by severity
-    high = [i for i in all_issues if i['severity'] == 'HIGH']
-    medium = [i for i in all_issues if i['severity'] == 'MEDIUM']
-    low = [i for i in all_issues if i['severity'] == 'LOW']
+    # Issues were grouped by severity as they were collected
+    high = buckets[SEV_HIGH]
+    medium = buckets[SEV_MEDIUM]
+    low = buckets[SEV_LOW]
     
     if high:
         print(f"\n🔴 HIGH SEVERITY ({len(high)} issues):")
         for issue in high:
-            print(f"\n  {issue['type']}")
-            print(f"  Location: {issue['file']}:{issue['line']}")
-            print(f"  Message: {issue['message']}")
-            print(f"  Code: {issue['code']}")
+            print(f"\n  {issue.type}")
+            print(f"  Location: {issue.file}:{issue.line}")
+            print(f"  Message: {issue.message}")
+            print(f"  Code: {issue.code}")
     
     if medium:
         print(f"\n🟡 MEDIUM SEVERITY ({len(medium)} issues):")
         for issue in medium:
-            print(f"\n  {issue['type']}")
-            print(f"  Location: {issue['file']}:{issue['line']}")
-            print(f"  Message: {issue['message']}")
-            print(f"  Code: {issue['code']}")
+            print(f"\n  {issue.type}")
+            print(f"  Location: {issue.file}:{issue.line}")
+            print(f"  Message: {issue.message}")
+            print(f"  Code: {issue.code}")
     
     if low:
         print(f"\n🟢 LOW SEVERITY ({len(low)} issues):")
         for issue in low:
-            print(f"\n  {issue['type']}")
-            print(f"  Location: {issue['file']}:{issue['line']}")
-            print(f"  Message: {issue['message']}")
+            print(f"\n  {issue.type}")
+            print(f"  Location: {issue.file}:{issue.line}")
+            print(f"  Message: {issue.message}")
     
     print("\n" + "="*60)
-    print(f"Total issues: {len(all_issues)} (High: {len(high)}, Medium: {len(medium)}, Low: {len(low)})")
+    print(f"Total issues: {total} (High: {len(high)}, Medium: {len(medium)}, Low: {len(low)})")
     print("="*60)
     
     # Return non-zero only for high severity issues
@@ -176,5 +306,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
@@ -129,7 +129,7 @@ require_file "$VERSION_FILE" "Version file"
 
 mkdir -p "$ROOT_DIR/dist" "$ROOT_DIR/build"
 
-"$PYTHON_BIN" -m PyInstaller --clean --noconfirm --onefile --console --name "$BINARY_NAME" "$ROOT_DIR/explorer.py"
+"$PYTHON_BIN" -m PyInstaller --clean --noconfirm --onefile --console --name "$BINARY_NAME" --add-data "$ROOT_DIR/explorer.tcss:." "$ROOT_DIR/explorer.py"
 
 rm -rf "$APP_DIR"
 osacompile -o "$APP_DIR" "$APP_SCRIPT"
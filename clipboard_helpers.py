@@ -1,80 +1,245 @@
 from __future__ import annotations
 
+import errno
+import functools
 import os
 import shutil
+import stat
+import sys
+import tempfile
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterable
+
+# Name comparisons follow the case rules of the platform's default filesystems
+_name_key = str.casefold if os.name == "nt" or sys.platform == "darwin" else str
+
+def _existing_names(destination: str) -> set[str]:
+    """Return the entry names in destination with one directory read."""
+    try:
+        with os.scandir(destination) as entries:
+            return {_name_key(entry.name) for entry in entries}
+    except OSError:
+        return set()
+
+def _next_free_name(basename: str, existing: set[str]) -> str:
+    """Return the first "name (N).ext" variant of basename that is not in existing."""
+    name, ext = os.path.splitext(basename)
+    counter = 1
+    while _name_key(f"{name} ({counter}){ext}") in existing:
+        counter += 1
+    return f"{name} ({counter}){ext}"
+
+def _same_fs(a: str, b: str) -> bool:
+    """Return True if both paths live on the same filesystem device."""
+    try:
+        return os.stat(a).st_dev == os.stat(b).st_dev
+    except OSError:
+        return False
+
+def _move(source: str, dest_path: str, destination: str) -> None:
+    """Move source to dest_path, renaming in place when both share a filesystem."""
+    if _same_fs(source, destination):
+        try:
+            os.replace(source, dest_path)
+            return
+        except OSError as e:
+            # Bind mounts can share st_dev but still refuse a rename
+            if e.errno != errno.EXDEV:
+                raise
+    shutil.move(source, dest_path)
+
+# Windows copies go through the OS copy engine: CopyFileExW for files (data,
+# attributes and timestamps, like copy2) and multithreaded robocopy for trees.
+_COPY_FILE_NO_BUFFERING = 0x1000
+# Large files skip the system cache; smaller ones are likely to be read again soon
+_UNBUFFERED_COPY_MIN_SIZE = 64 << 20
+# robocopy exit codes 0-7 report success (bit flags for copied/extra/mismatched)
+_ROBOCOPY_MAX_SUCCESS = 7
+
+def _win_copy_file(source: str, dest_path: str) -> str:
+    """copy2 equivalent for Windows backed by kernel32.CopyFileExW."""
+    import ctypes
+    try:
+        size = os.stat(source).st_size
+    except OSError:
+        size = 0
+    flags = _COPY_FILE_NO_BUFFERING if size >= _UNBUFFERED_COPY_MIN_SIZE else 0
+    if not ctypes.windll.kernel32.CopyFileExW(source, dest_path, None, None, None, flags):
+        raise ctypes.WinError()
+    return dest_path
+
+@functools.lru_cache(maxsize=1)
+def _robocopy() -> str | None:
+    return shutil.which("robocopy")
+
+def _robocopy_tree(source: str, dest_path: str) -> None:
+    """Copy a directory tree with robocopy using 8 threads."""
+    # Imported here: only Windows directory pastes need it
+    import subprocess
+    command = [
+        _robocopy(), os.path.normpath(source), os.path.normpath(dest_path),
+        "/E", "/MT:8", "/NFL", "/NDL", "/NJH", "/NJS", "/NP",
+    ]
+    result = subprocess.run(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+    if result.returncode > _ROBOCOPY_MAX_SUCCESS:
+        raise OSError(f"robocopy failed with exit code {result.returncode}: {source}")
+
+# paste() reports progress to its callback after this many items
+PASTE_PROGRESS_EVERY = 64
 
 class ClipboardManager:
-    """Manages file clipboard operations (copy/cut/paste)."""
-    def __init__(self):
-        self.items: list[str] = []
+    """Manages file clipboard operations (copy/cut/paste).
+
+    ``preserve_metadata=False`` copies file contents without timestamps and
+    permission bits. ``link_copies=True`` hardlinks copied files instead of
+    duplicating their bytes when source and destination share a filesystem;
+    the copies then share an inode, so editing one edits the other.
+    """
+    def __init__(self, preserve_metadata: bool = True, link_copies: bool = False):
+        # Insertion-ordered set of paths: duplicates collapse in O(1) per path
+        self._items: dict[str, None] = {}
         self.operation: str = ""  # "copy" or "cut"
         self.last_errors: list[tuple[str, Exception]] = []
+        self.preserve_metadata = preserve_metadata
+        self.link_copies = link_copies
     
-    def copy(self, paths: list[str]) -> None:
-        self.items = paths.copy()
+    @property
+    def items(self) -> list[str]:
+        """The clipboard paths in the order they were added, without duplicates."""
+        return list(self._items)
+
+    def copy(self, paths: Iterable[str]) -> None:
+        """Put paths on the clipboard for copying."""
+        self._items = dict.fromkeys(paths)
         self.operation = "copy"
     
-    def cut(self, paths: list[str]) -> None:
-        self.items = paths.copy()
+    def cut(self, paths: Iterable[str]) -> None:
+        """Put paths on the clipboard for moving."""
+        self._items = dict.fromkeys(paths)
         self.operation = "cut"
     
-    def paste(self, destination: str) -> list[tuple[str, str]]:
-        """Paste items to destination. Returns list of (source, dest) tuples."""
+    def paste(
+        self,
+        destination: str,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> list[tuple[str, str]]:
+        """Paste items to destination. Returns list of (source, dest) tuples.
+
+        ``progress(done, total)`` is called every PASTE_PROGRESS_EVERY items.
+        The items and operation are read once up front, so the clipboard may be
+        refilled from another thread while a paste is running.
+        """
         results = []
         self.last_errors = []
-        for item in self.items:
-            if not os.path.exists(item):
+        items, operation = self._items, self.operation
+        total = len(items)
+        existing = _existing_names(destination)
+        for done, item in enumerate(items):
+            if progress is not None and done and done % PASTE_PROGRESS_EVERY == 0:
+                progress(done, total)
+            try:
+                is_dir = stat.S_ISDIR(os.stat(item).st_mode)
+            except OSError:
                 continue
             
             basename = os.path.basename(item)
-            dest_path = os.path.join(destination, basename)
             
             # Handle name conflicts
-            if os.path.exists(dest_path):
-                name, ext = os.path.splitext(basename)
-                counter = 1
-                while os.path.exists(dest_path):
-                    dest_path = os.path.join(destination, f"{name} ({counter}){ext}")
-                    counter += 1
+            if _name_key(basename) in existing:
+                basename = _next_free_name(basename, existing)
+            dest_path = os.path.join(destination, basename)
             
             try:
-                if self.operation == "copy":
-                    if os.path.isdir(item):
-                        shutil.copytree(item, dest_path)
+                if operation == "copy":
+                    if self.link_copies and _same_fs(item, destination):
+                        copy_function = os.link
+                    elif self.preserve_metadata:
+                        copy_function = _win_copy_file if os.name == "nt" else shutil.copy2
+                    else:
+                        copy_function = shutil.copy
+                    if is_dir and copy_function is _win_copy_file and _robocopy():
+                        _robocopy_tree(item, dest_path)
+                    elif is_dir:
+                        shutil.copytree(item, dest_path, copy_function=copy_function)
                     else:
-                        shutil.copy2(item, dest_path)
-                elif self.operation == "cut":
-                    shutil.move(item, dest_path)
+                        copy_function(item, dest_path)
+                elif operation == "cut":
+                    _move(item, dest_path, destination)
                 
                 results.append((item, dest_path))
+                existing.add(_name_key(basename))
             except Exception as e:
                 self.last_errors.append((item, e))
         
-        # Clear clipboard after cut operation
-        if self.operation == "cut":
+        # Clear clipboard after cut operation, unless it was refilled meanwhile
+        if operation == "cut" and self._items is items:
             self.clear()
         
         return results
     
     def clear(self) -> None:
-        self.items = []
+        self._items = {}
         self.operation = ""
     
     def has_items(self) -> bool:
-        return len(self.items) > 0
+        return bool(self._items)
+
+# Undone pastes and duplicates are parked in a per-session temp folder instead
+# of being deleted, so redo is a rename rather than a fresh copy. Only items on
+# the temp folder's filesystem are stashed; anything else would need a full
+# copy, so stash_path refuses it and the caller deletes the item instead.
+STASH_PREFIX = "tex_stash_"
+
+def new_stash_root() -> str:
+    """Create and return a private folder to hold one session's stashed items."""
+    return tempfile.mkdtemp(prefix=STASH_PREFIX)
+
+def stash_path(path: str, stash_root: str) -> str:
+    """Rename path into a new folder under stash_root and return the stashed location.
+
+    Raises OSError with errno EXDEV, leaving path untouched, when path is on a
+    different filesystem from stash_root.
+    """
+    if os.lstat(path).st_dev != os.stat(stash_root).st_dev:
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), path)
+    stash_dir = os.path.join(stash_root, uuid.uuid4().hex)
+    os.mkdir(stash_dir)
+    stashed = os.path.join(stash_dir, os.path.basename(path))
+    try:
+        os.rename(path, stashed)
+    except OSError:
+        os.rmdir(stash_dir)
+        raise
+    return stashed
+
+def restore_path(stashed: str, path: str) -> None:
+    """Rename a stashed item back to path and drop its now-empty stash folder."""
+    if os.path.lexists(path):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), path)
+    os.rename(stashed, path)
+    discard_stash(stashed)
+
+def discard_stash(stashed: str) -> None:
+    """Delete a stashed item together with its stash folder."""
+    shutil.rmtree(os.path.dirname(stashed), ignore_errors=True)
 
 class OperationHistory:
     """Tracks file operations for undo/redo."""
     def __init__(self, max_size: int = 50):
         self.max_size = max_size
-        self.undo_stack: list[dict] = []
-        self.redo_stack: list[dict] = []
+        # Bounded deques drop the oldest entry in O(1) once max_size is reached
+        self.undo_stack: deque[dict] = deque(maxlen=max_size)
+        self.redo_stack: deque[dict] = deque(maxlen=max_size)
     
     def record(self, operation: str, **kwargs) -> None:
         """Record an operation. Clears redo stack."""
         self.undo_stack.append({"op": operation, **kwargs})
-        if len(self.undo_stack) > self.max_size:
-            self.undo_stack.pop(0)
         self.redo_stack.clear()
     
     def can_undo(self) -> bool:
@@ -1,26 +1,97 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
+import operator
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 from pathlib import Path
 from urllib.parse import quote
 from rich.control import Control
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, DataTable, Static, Label, Input, Button, Tree
 from textual.widgets.tree import TreeNode
 from textual.screen import ModalScreen
 from textual.binding import Binding
-from textual import events
+from textual import events, work
+from textual.worker import get_current_worker
 import os
 import re
 import shutil
+import stat
 import sys
 import datetime
+import errno
+import struct
 import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
 import send2trash
-from clipboard_helpers import ClipboardManager, OperationHistory
-
+from clipboard_helpers import ClipboardManager, OperationHistory, new_stash_root, restore_path, stash_path
+
+# Rows posted to the file list per UI-thread hop while a directory is scanned
+SCAN_BATCH_SIZE = 500
+
+# A file list row: name, size, modified and type cells plus the row key (full path).
+# Cells are prebuilt Text so DataTable renders them as-is instead of parsing each
+# string as markup, which also keeps names containing "[" literal.
+FileRow = tuple[Text, Text, Text, Text, str]
+_cell = functools.partial(Text, no_wrap=True, end="")
+
+# Folders added under one sidebar node before the rest are summarised
+TREE_CHILD_LIMIT = 2000
+
+# Seconds over which toolbar and file list refreshes are coalesced
+UI_FLUSH_DELAY = 0.05
+
+# Minimum seconds between "Pasting… n/total" notifications
+PASTE_PROGRESS_INTERVAL = 1.0
+
+# Directories remembered per pane for back/forward navigation
+HISTORY_LIMIT = 256
+
+# Finished directory listings keyed by (path, show_hidden), most recent last.
+# Each entry stores the directory's st_mtime_ns so any add, remove or rename
+# in it invalidates the rows on the next visit. Listings longer than
+# DIR_CACHE_MAX_ROWS are streamed and not kept.
+# Writing to a file in place does not change its directory's mtime, and on
+# coarse-timestamp filesystems (FAT, HFS+, some NFS) even adding or removing
+# an entry may not, so changes made outside the app can show stale rows until
+# the pane is refreshed. The app relists without the cache after its own
+# changes and drops the cached listings of other folders they touch.
+_DIR_CACHE_LIMIT = 32
+DIR_CACHE_MAX_ROWS = 20000
+_dir_cache: OrderedDict[tuple[str, bool], tuple[int, list[FileRow]]] = OrderedDict()
+
+def forget_listings(paths: Iterable[str]) -> None:
+    """Drop cached listings of the directories holding the given paths."""
+    for directory in {os.path.dirname(path) for path in paths}:
+        for show_hidden in (False, True):
+            _dir_cache.pop((directory, show_hidden), None)
+
+def operation_paths(op: dict) -> list[str]:
+    """Return every path an undo/redo history entry touches."""
+    paths = [dest for _, dest in op.get("items", ())]
+    paths.extend(op[key] for key in ("path", "dest", "old_path", "new_path") if key in op)
+    return paths
+
+# Formatted "Date Modified" strings keyed by minute; many entries share an mtime
+_MTIME_CACHE_LIMIT = 4096
+_mtime_cache: dict[int, str] = {}
+
+def format_mtime(timestamp: float) -> str:
+    """Format a modification time to minute precision, reusing earlier results."""
+    minute = int(timestamp // 60)
+    text = _mtime_cache.get(minute)
+    if text is None:
+        if len(_mtime_cache) >= _MTIME_CACHE_LIMIT:
+            _mtime_cache.clear()
+        text = datetime.datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+        _mtime_cache[minute] = text
+    return text
 
 def resolve_initial_path(argv: list[str]) -> str:
     """Resolve the first usable launch path from command-line arguments."""
@@ -32,12 +103,261 @@ def resolve_initial_path(argv: list[str]) -> str:
             return os.path.dirname(candidate)
     return os.getcwd()
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+_FOLDER_TYPE = sys.intern("Folder")
+_FILE_TYPE = sys.intern("File")
+# Decorated (key, ...) tuples are sorted on their first item by a C-level getter
+_SORT_KEY = operator.itemgetter(0)
+
+_FOLDER_ICON = "📁"
+_FILE_ICON = "📄"
+
+def file_type_for_name(name: str) -> str:
+    """Return the "Type" column for a file name, matching os.path.splitext rules."""
+    stem = name.lstrip(".")
+    dot = stem.rfind(".")
+    return stem[dot + 1:].upper() if dot >= 0 and dot < len(stem) - 1 else _FILE_TYPE
+
+@functools.lru_cache(maxsize=1)
+def windows_drive_roots() -> tuple[str, ...]:
+    """Return the drive roots present on Windows, with C:\\ first.
+
+    One GetLogicalDrives bitmask call replaces probing every letter, which can
+    stall for a long time on empty removable-media drives.
+    """
+    try:
+        import ctypes
+        mask = ctypes.windll.kernel32.GetLogicalDrives()
+    except (ImportError, AttributeError, OSError):
+        mask = 0
+    if mask:
+        letters = [chr(ord("A") + i) for i in range(26) if mask & (1 << i)]
+    else:
+        import string
+        letters = [letter for letter in string.ascii_uppercase if os.path.exists(f"{letter}:\\")]
+    return ("C:\\",) + tuple(f"{letter}:\\" for letter in letters if letter != "C")
+
+@functools.lru_cache(maxsize=1)
+def favorite_paths() -> tuple[tuple[str, str, str], ...]:
+    """Return (name, path, icon) for the common user folders that exist.
+
+    Computed once per process so every SystemTree reuses the same four stats.
+    """
+    home = os.path.expanduser("~")
+    favorites = (("Home", home, "🏠"),) + tuple(
+        (name, os.path.join(home, name), "📁") for name in ("Desktop", "Documents", "Downloads")
+    )
+    return tuple(favorite for favorite in favorites if os.path.exists(favorite[1]))
+
+# Directories whose inode reports at least this many bytes are listed with raw
+# getdents64 calls on Linux; below it libc's readdir buffer is good enough
+_GETDENTS_MIN_DIR_SIZE = 1 << 20
+_GETDENTS_BUFFER_SIZE = 1 << 20
+_GETDENTS_SYSCALLS = {"x86_64": 217, "i386": 220, "i686": 220, "aarch64": 61, "arm64": 61,
+                      "riscv64": 61, "ppc64le": 202, "ppc64": 202, "s390x": 220}
+_DT_UNKNOWN, _DT_DIR, _DT_LNK = 0, 4, 10
+# linux_dirent64: u64 d_ino, s64 d_off, u16 d_reclen, u8 d_type, char d_name[]
+_DIRENT_RECLEN = struct.Struct("=H").unpack_from
+_DIRENT_RECLEN_OFFSET, _DIRENT_TYPE_OFFSET, _DIRENT_NAME_OFFSET = 16, 18, 19
+
+class _RawEntry:
+    """The subset of os.DirEntry used by the file list, built from a getdents64 record."""
+
+    __slots__ = ("name", "path", "_is_dir", "_d_type")
+
+    def __init__(self, name: str, path: str, is_dir: bool, d_type: int):
+        self.name = name
+        self.path = path
+        self._is_dir = is_dir
+        self._d_type = d_type
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks or self._d_type == _DT_DIR:
+            return self._is_dir
+        if self._d_type == _DT_UNKNOWN:
+            try:
+                return stat.S_ISDIR(os.lstat(self.path).st_mode)
+            except OSError:
+                return False
+        return False
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        return os.stat(self.path, follow_symlinks=follow_symlinks)
+
+@functools.lru_cache(maxsize=1)
+def _getdents64():
+    """Return (libc.syscall, syscall number) for getdents64, or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    import platform
+    number = _GETDENTS_SYSCALLS.get(platform.machine())
+    if number is None:
+        return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        return libc.syscall, number
+    except (ImportError, OSError, AttributeError):
+        return None
+
+def _use_fast_scandir(path: str) -> bool:
+    """Return True if path is a Linux directory large enough for _fast_scandir."""
+    if _getdents64() is None:
+        return False
+    try:
+        return os.stat(path).st_size >= _GETDENTS_MIN_DIR_SIZE
+    except OSError:
+        return False
+
+def _fast_scandir(path: str):
+    """Yield (entry, is_dir) pairs for path using getdents64 with a 1 MiB buffer.
+
+    The file type comes from d_type, so only symlinks and filesystems that
+    report DT_UNKNOWN need a stat to tell folders from files.
+    """
+    import ctypes
+    syscall, number = _getdents64()
+    buf = ctypes.create_string_buffer(_GETDENTS_BUFFER_SIZE)
+    prefix = path if path.endswith(os.sep) else path + os.sep
+    encoding = sys.getfilesystemencoding()
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            nread = syscall(number, fd, buf, _GETDENTS_BUFFER_SIZE)
+            if nread < 0:
+                err = ctypes.get_errno()
+                raise OSError(err, os.strerror(err), path)
+            if nread == 0:
+                return
+            data = buf.raw[:nread]
+            pos = 0
+            while pos < nread:
+                (reclen,) = _DIRENT_RECLEN(data, pos + _DIRENT_RECLEN_OFFSET)
+                d_type = data[pos + _DIRENT_TYPE_OFFSET]
+                start = pos + _DIRENT_NAME_OFFSET
+                raw_name = data[start:data.find(b"\0", start)]
+                pos += reclen
+                if raw_name == b"." or raw_name == b"..":
+                    continue
+                name = raw_name.decode(encoding, "surrogateescape")
+                full_path = prefix + name
+                if d_type == _DT_DIR:
+                    is_dir = True
+                elif d_type == _DT_LNK or d_type == _DT_UNKNOWN:
+                    is_dir = os.path.isdir(full_path)
+                else:
+                    is_dir = False
+                yield _RawEntry(name, full_path, is_dir, d_type), is_dir
+    finally:
+        os.close(fd)
+
+# Filesystems where every stat is a network round trip worth overlapping
+NETWORK_STAT_WORKERS = 16
+_NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "9p", "ceph", "glusterfs",
+    "fuse.sshfs", "fuse.rclone", "davfs", "fuse.davfs2",
+})
+_DRIVE_REMOTE = 4
+
+# Parsed /proc/self/mounts, reread at most once per TTL. procfs reports no
+# useful mtime for it, so a short expiry is what picks up new mounts.
+MOUNT_TABLE_TTL = 5.0
+_mount_table_cache: tuple[float, list[tuple[str, str, str]]] | None = None
+
+def _unescape_mount_field(field: str) -> str:
+    """Decode the octal escapes (\\040 for a space) used in /proc/self/mounts."""
+    return re.sub(r"\\([0-7]{3})", lambda match: chr(int(match.group(1), 8)), field)
+
+def is_network_path(path: str) -> bool:
+    """Return True if path lives on a network share (UNC, mapped drive, NFS/SMB mount)."""
+    if os.name == "nt":
+        if path.startswith(("\\\\", "//")):
+            return True
+        try:
+            import ctypes
+            root = os.path.splitdrive(os.path.abspath(path))[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(root) == _DRIVE_REMOTE
+        except (ImportError, AttributeError, OSError):
+            return False
+    if not sys.platform.startswith("linux"):
+        return False
+    table = _mount_table()
+    # Most systems mount no network filesystem at all; skip resolving the path
+    if not any(fs_type in _NETWORK_FS_TYPES for _, _, fs_type in table):
+        return False
+    real = os.path.realpath(path)
+    for mount_point, prefix, fs_type in table:
+        if real == mount_point or real.startswith(prefix):
+            return fs_type in _NETWORK_FS_TYPES
+    return False
+
+def _mount_table() -> list[tuple[str, str, str]]:
+    """Return (mount point, prefix, fs type) for every mount, longest mount point first."""
+    global _mount_table_cache
+    now = time.monotonic()
+    if _mount_table_cache is not None and now - _mount_table_cache[0] < MOUNT_TABLE_TTL:
+        return _mount_table_cache[1]
+    table = []
+    with contextlib.suppress(OSError), open("/proc/self/mounts", encoding="utf-8", errors="replace") as mounts:
+        for line in mounts:
+            fields = line.split()
+            if len(fields) < 3:
+                continue
+            mount_point = _unescape_mount_field(fields[1])
+            table.append((mount_point, mount_point.rstrip("/") + "/", fields[2]))
+    # A stable sort keeps the later of two mounts on the same point first, as it shadows the earlier
+    table.reverse()
+    table.sort(key=lambda mount: len(mount[0]), reverse=True)
+    _mount_table_cache = (now, table)
+    return table
+
+def _lstat_or_none(entry) -> os.stat_result | None:
+    """Stat a directory entry without following links, or None if it vanished."""
+    try:
+        return entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+# External terminals, in order of preference. Argv templates have "{path}"
+# replaced with the directory to open; Windows entries also name the
+# subprocess creation flag to launch with.
+_WINDOWS_TERMINALS = (
+    ("Windows Terminal", ("wt.exe", "-d", "{path}"), "CREATE_NO_WINDOW"),
+    ("PowerShell", ("pwsh.exe", "-NoExit", "-Command", "Set-Location -LiteralPath $args[0]", "{path}"), "CREATE_NEW_CONSOLE"),
+    ("Command Prompt", ("cmd.exe", "/k", "cd", "/d", "{path}"), "CREATE_NEW_CONSOLE"),
+)
+_LINUX_TERMINALS = (
+    ("GNOME Terminal", ("gnome-terminal", "--working-directory={path}")),
+    ("Konsole", ("konsole", "--workdir", "{path}")),
+    ("XFCE Terminal", ("xfce4-terminal", "--working-directory", "{path}")),
+    ("Kitty", ("kitty", "--directory", "{path}")),
+    ("Alacritty", ("alacritty", "--working-directory", "{path}")),
+    ("WezTerm", ("wezterm", "start", "--cwd", "{path}")),
+)
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name: str) -> str | None:
+    """Return shutil.which(name), remembered for the life of the process."""
+    return shutil.which(name)
+
+def terminal_executables() -> tuple[str, ...]:
+    """Return the terminal programs this platform may launch, in preference order."""
+    if os.name == "nt":
+        return tuple(template[0] for _, template, _ in _WINDOWS_TERMINALS)
+    if sys.platform == "darwin":
+        return ()
+    return tuple(template[0] for _, template in _LINUX_TERMINALS)
+
 class ResizeHandle(Static):
     def __init__(self, target_id: str, vertical: bool = False, **kwargs):
         super().__init__("", **kwargs)
         self.target_id = target_id
         self.vertical = vertical
         self.dragging = False
+        # Drag moves are coalesced so the target is re-laid out at most once a frame
+        self._pending_size: int | None = None
+        self._timer = None
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
         self.capture_mouse()
@@ -46,17 +366,33 @@ class ResizeHandle(Static):
     def on_mouse_up(self, event: events.MouseUp) -> None:
         self.release_mouse()
         self.dragging = False
+        if self._timer is not None:
+            self._timer.stop()
+        self._flush_size()
 
     def on_mouse_move(self, event: events.MouseMove) -> None:
         if not self.dragging: return
-        target = self.app.query_one(f"#{self.target_id}")
         if self.vertical:
             new_height = self.app.size.height - event.screen_y
             if new_height > 5:
-                target.styles.height = new_height
+                self._pending_size = new_height
         else:
             if event.screen_x > 5:
-                target.styles.width = event.screen_x
+                self._pending_size = event.screen_x
+        if self._pending_size is not None and self._timer is None:
+            self._timer = self.set_timer(1 / 60, self._flush_size)
+
+    def _flush_size(self) -> None:
+        """Apply the latest size seen during the drag to the target widget."""
+        self._timer = None
+        if self._pending_size is None:
+            return
+        target = self.app.query_one(f"#{self.target_id}")
+        if self.vertical:
+            target.styles.height = self._pending_size
+        else:
+            target.styles.width = self._pending_size
+        self._pending_size = None
 
 class InputScreen(ModalScreen[str]):
     def __init__(self, prompt: str, initial_value: str = "", placeholder: str = ""):
@@ -152,32 +488,14 @@ class SystemTree(Tree[dict]):
 
     def on_mount(self) -> None:
         favorites = self.root.add("⭐ Favorites", expand=True) 
-        home = os.path.expanduser("~")
-        
-        common_paths = {
-            "Home": home,
-            "Desktop": os.path.join(home, "Desktop"),
-            "Documents": os.path.join(home, "Documents"),
-            "Downloads": os.path.join(home, "Downloads"),
-        }
-        
-        for name, path in common_paths.items():
-            if os.path.exists(path):
-                icon = "🏠" if name=="Home" else "📁"
-                favorites.add(f"{icon} {name}", data={"path": path, "is_dir": True, "loaded": False}, allow_expand=True)
+        for name, path, icon in favorite_paths():
+            favorites.add(f"{icon} {name}", data={"path": path, "is_dir": True, "loaded": False}, allow_expand=True)
 
         roots = self.root.add("DISK Drives", expand=True)
         available_roots: list[str] = []
 
         if os.name == "nt":
-            available_roots.append("C:\\")
-            import string
-            for letter in string.ascii_uppercase:
-                if letter == "C":
-                    continue
-                path = f"{letter}:\\"
-                if os.path.exists(path):
-                    available_roots.append(path)
+            available_roots.extend(windows_drive_roots())
         else:
             available_roots.append(os.path.sep)
             for extra_root in ("/Volumes", "/mnt", "/media"):
@@ -208,11 +526,13 @@ class SystemTree(Tree[dict]):
         path = node.data["path"]
         node.remove_children() 
         try:
-            entries = list(os.scandir(path))
-            entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
-            for entry in entries:
-                if entry.is_dir():
-                    node.add(f"📁 {entry.name}", data={"path": entry.path, "is_dir": True, "loaded": False}, allow_expand=True)
+            with os.scandir(path) as it:
+                entries = [(entry.name.lower(), entry) for entry in it if entry.is_dir()]
+            entries.sort(key=_SORT_KEY)
+            for _, entry in entries[:TREE_CHILD_LIMIT]:
+                node.add(f"📁 {entry.name}", data={"path": entry.path, "is_dir": True, "loaded": False}, allow_expand=True)
+            if len(entries) > TREE_CHILD_LIMIT:
+                node.add_leaf(f"… ({len(entries) - TREE_CHILD_LIMIT} more)")
             node.data["loaded"] = True
         except PermissionError:
             node.data["loaded"] = True
@@ -423,10 +743,16 @@ class FilePane(Container):
         yield FileList()
 
     def on_mount(self) -> None:
-        self.history: list[str] = []
+        # Widgets touched on every navigation are looked up once
+        self.table = self.query_one(FileList)
+        self._back_button = self.query_one("#back", Button)
+        self._forward_button = self.query_one("#forward", Button)
+        self._address_bar = self.query_one("#address-bar", Input)
+        self.history: deque[str] = deque(maxlen=HISTORY_LIMIT)
         self.history_index: int = -1
         self.current_path = self.app.initial_path
         self.show_hidden = False
+        self._scan_generation = 0
         self.update_file_list(self.current_path)
 
     def on_file_double_clicked(self, path: str) -> None:
@@ -523,7 +849,7 @@ class FilePane(Container):
             elif action == "copy_file": self.app.action_copy_files()
             elif action == "cut_file": self.app.action_cut_files()
             elif action == "paste_file": self.app.action_paste_files()
-            elif action == "refresh": self.update_file_list(self.current_path, add_to_history=False)
+            elif action == "refresh": self.action_refresh()
             elif action == "new_file": self.action_new_file()
             elif action == "new_folder": self.action_new_folder()
             elif action == "reveal": self.action_reveal_selected()
@@ -551,40 +877,51 @@ class FilePane(Container):
                     if hasattr(self.app, "history"):
                         self.app.history.record("create_file", path=path)
                     self.app.notify(f"Created file: {name}")
-                    self.update_file_list(self.current_path, add_to_history=False)
+                    self.action_refresh()
                 except Exception as e:
                     self.app.notify(f"Error: {e}", severity="error")
         self.app.push_screen(InputScreen("New File Name:", "new_file.txt"), handle_input)
 
     def action_duplicate_file(self) -> None:
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count: return
         try:
             path = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
             dirname = os.path.dirname(path)
             basename = os.path.basename(path)
             name, ext = os.path.splitext(basename)
-            new_path = os.path.join(dirname, f"{name} - Copy{ext}")
-            
-            counter = 1
-            while os.path.exists(new_path):
-                new_path = os.path.join(dirname, f"{name} - Copy ({counter}){ext}")
-                counter += 1
-                
-            if os.path.isdir(path):
-                shutil.copytree(path, new_path)
-            else:
-                shutil.copy2(path, new_path)
-                
+            is_dir = os.path.isdir(path)
+
+            # Try each candidate name and move on when it is taken, instead of
+            # stat'ing ahead of the copy (which also races other writers)
+            counter = 0
+            while True:
+                suffix = " - Copy" if counter == 0 else f" - Copy ({counter})"
+                new_path = os.path.join(dirname, f"{name}{suffix}{ext}")
+                try:
+                    if is_dir:
+                        shutil.copytree(path, new_path)
+                    else:
+                        # O_EXCL claims the name; copy2 then fills the empty file
+                        os.close(os.open(new_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                        try:
+                            shutil.copy2(path, new_path)
+                        except OSError:
+                            os.remove(new_path)
+                            raise
+                    break
+                except FileExistsError:
+                    counter += 1
+
             if hasattr(self.app, "history"):
                 self.app.history.record("duplicate", source=path, dest=new_path)
             self.app.notify(f"Duplicated to: {os.path.basename(new_path)}")
-            self.update_file_list(self.current_path, add_to_history=False)
+            self.action_refresh()
         except Exception as e:
              self.app.notify(f"Error duplicating: {e}", severity="error")
              
     def action_properties(self) -> None:
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count: return
         try:
             path = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
@@ -601,14 +938,14 @@ class FilePane(Container):
                     if hasattr(self.app, "history"):
                         self.app.history.record("create_folder", path=path)
                     self.app.notify(f"Created: {name}")
-                    self.update_file_list(self.current_path, add_to_history=False)
+                    self.action_refresh()
                 except Exception as e:
                     self.app.notify(f"Error: {e}", severity="error")
         
         self.app.push_screen(InputScreen("New Folder Name:", "New Folder"), handle_input)
 
     def action_open_selected(self) -> None:
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count: return
         try:
             path = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
@@ -617,7 +954,7 @@ class FilePane(Container):
             self.app.notify(f"Error opening item: {e}", severity="error")
 
     def _selected_path(self) -> str | None:
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count:
             return None
         return table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
@@ -693,7 +1030,7 @@ class FilePane(Container):
             if hasattr(self.app, "history"):
                 self.app.history.record("create_file", path=archive)
             self.app.notify(f"Created ZIP: {os.path.basename(archive)}")
-            self.update_file_list(self.current_path, add_to_history=False)
+            self.action_refresh()
         except Exception as e:
             self.app.notify(f"Error creating ZIP: {e}", severity="error")
 
@@ -722,7 +1059,7 @@ class FilePane(Container):
         try:
             os.utime(path, None)
             self.app.notify(f"Updated modified time: {os.path.basename(path)}")
-            self.update_file_list(self.current_path, add_to_history=False)
+            self.update_file_list(self.current_path, add_to_history=False, use_cache=False)
         except Exception as e:
             self.app.notify(f"Error touching item: {e}", severity="error")
 
@@ -741,20 +1078,19 @@ class FilePane(Container):
             self.app.notify(f"Error changing permissions: {e}", severity="error")
 
     def action_delete_file(self) -> None:
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count: return
         try:
             path = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
-            if os.path.exists(path):
-                send2trash.send2trash(path)
-                self.app.notify(f"Moved to trash: {path}")
-                self.update_file_list(self.current_path, add_to_history=False)
+            send2trash.send2trash(path)
+            self.app.notify(f"Moved to trash: {path}")
+            self.action_refresh()
         except Exception as e:
             self.app.notify(f"Error deleting: {e}", severity="error")
     
     def action_open_with(self) -> None:
         """Open file with selected application."""
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count:
             return
         
@@ -771,7 +1107,7 @@ class FilePane(Container):
 
     def action_rename_file(self) -> None:
         """Rename the selected file."""
-        table = self.query_one(FileList)
+        table = self.table
         if not table.row_count: return
         try:
             path = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
@@ -787,7 +1123,7 @@ class FilePane(Container):
                     if hasattr(self.app, "history"):
                         self.app.history.record("rename", old_path=path, new_path=new_path)
                     self.app.notify(f"Renamed to: {new_name}")
-                    self.update_file_list(self.current_path, add_to_history=False)
+                    self.action_refresh()
                 except Exception as e:
                     self.app.notify(f"Error renaming: {e}", severity="error")
         
@@ -812,7 +1148,7 @@ class FilePane(Container):
 
     def action_refresh(self) -> None:
         """Refresh this pane's current directory."""
-        self.update_file_list(self.current_path, add_to_history=False)
+        self.update_file_list(self.current_path, add_to_history=False, use_cache=False)
 
     def action_toggle_hidden(self) -> None:
         """Toggle display of hidden files in this pane."""
@@ -828,54 +1164,140 @@ class FilePane(Container):
         """Handle address bar Enter."""
         if event.input.id == "address-bar":
             path = event.value
-            if os.path.exists(path) and os.path.isdir(path):
+            try:
+                is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+            except (OSError, ValueError):
+                is_dir = False
+            if is_dir:
                 self.update_file_list(path)
             else:
                 self.app.notify(f"Invalid path: {path}", severity="error")
 
-    def update_file_list(self, path: str, add_to_history: bool = True) -> None:
+    def update_file_list(self, path: str, add_to_history: bool = True, use_cache: bool = True) -> None:
         """Update the file list with the contents of the given path."""
         if add_to_history and (not self.history or self.history[self.history_index] != path):
-            if self.history_index < len(self.history) - 1:
-                self.history = self.history[:self.history_index+1]
+            while len(self.history) > self.history_index + 1:
+                self.history.pop()
             self.history.append(path)
             self.history_index = len(self.history) - 1
             
         self.current_path = path
 
-        try:
-            self.query_one("#back", Button).disabled = self.history_index <= 0
-            self.query_one("#forward", Button).disabled = self.history_index >= len(self.history) - 1
-            self.query_one("#address-bar", Input).value = path
-        except Exception:
-            toolbar_available = False
-        else:
-            toolbar_available = True
+        self._back_button.disabled = self.history_index <= 0
+        self._forward_button.disabled = self.history_index >= len(self.history) - 1
+        self._address_bar.value = path
 
-        table = self.query_one(FileList)
+        table = self.table
         table.clear()
+        # Rows from a superseded scan are dropped when they reach the UI thread
+        self._scan_generation += 1
 
+        key = (path, self.show_hidden)
         try:
-            entries = list(os.scandir(path))
-            entries.sort(key=lambda e: (not e.is_dir(), e.name.lower()))
-            
-            for entry in entries:
-                try:
-                    if not self.show_hidden and self.is_hidden(entry):
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = _dir_cache.get(key) if use_cache else None
+        if cached is not None and cached[0] == mtime:
+            _dir_cache.move_to_end(key)
+            self.workers.cancel_group(self, "scan")
+            self._append_rows(self._scan_generation, cached[1])
+            return
+        self._scan_directory(path, self.show_hidden, self._scan_generation, mtime)
+
+    @work(thread=True, exclusive=True, group="scan")
+    def _scan_directory(self, path: str, show_hidden: bool, generation: int, mtime: int | None = None) -> None:
+        """Read a directory off the UI thread and post its rows back in batches."""
+        worker = get_current_worker()
+        rows: list[FileRow] = []
+        posted = 0
+        # A directory holds few distinct types, so their cells are shared by every row
+        type_cells: dict[str, Text] = {_FOLDER_TYPE: _cell(_FOLDER_TYPE)}
+        try:
+            # Decorate each entry with its sort key once; is_dir is reused for display
+            if _use_fast_scandir(path):
+                pairs = _fast_scandir(path)
+                entries = [((not is_dir, entry.name.lower()), entry, is_dir) for entry, is_dir in pairs]
+            else:
+                with os.scandir(path) as it:
+                    entries = []
+                    for entry in it:
+                        is_dir = entry.is_dir()
+                        entries.append(((not is_dir, entry.name.lower()), entry, is_dir))
+            # Sorted descending so entries can be popped off the end in display
+            # order, releasing each DirEntry as soon as its row is built
+            entries.sort(key=_SORT_KEY, reverse=True)
+            if not show_hidden:
+                entries = [item for item in entries if not self.is_hidden(item[1])]
+            # Huge listings are streamed without being kept for the cache, so the
+            # worker never holds every entry and every row at the same time
+            keep_rows = mtime is not None and len(entries) <= DIR_CACHE_MAX_ROWS
+
+            # On network shares each stat is a round trip; issue them concurrently
+            # and consume the results in order so rows still stream out sorted
+            pool = None
+            prefetched = None
+            if is_network_path(path):
+                pool = ThreadPoolExecutor(max_workers=NETWORK_STAT_WORKERS)
+                prefetched = pool.map(_lstat_or_none, [entry for _, entry, _ in reversed(entries)])
+            try:
+                while entries:
+                    if worker.is_cancelled:
+                        return
+                    _, entry, is_dir = entries.pop()
+                    try:
+                        stats = next(prefetched) if prefetched is not None else entry.stat(follow_symlinks=False)
+                        if stats is None:
+                            continue
+                        size = "" if is_dir else self.format_size(stats.st_size)
+                        modified = format_mtime(stats.st_mtime)
+                        file_type = _FOLDER_TYPE if is_dir else file_type_for_name(entry.name)
+                        type_cell = type_cells.get(file_type)
+                        if type_cell is None:
+                            type_cell = type_cells[file_type] = _cell(sys.intern(file_type))
+                        icon = _FOLDER_ICON if is_dir else _FILE_ICON
+
+                        rows.append((
+                            _cell(f"{icon} {entry.name}"),
+                            _cell(size, justify="right"),
+                            _cell(modified),
+                            type_cell,
+                            entry.path,
+                        ))
+                    except Exception:
                         continue
-                    stats = entry.stat()
-                    size = self.format_size(stats.st_size) if entry.is_file() else ""
-                    modified = datetime.datetime.fromtimestamp(stats.st_mtime).strftime("%Y-%m-%d %H:%M")
-                    file_type = "Folder" if entry.is_dir() else os.path.splitext(entry.name)[1].upper()[1:] or "File"
-                    icon = "📁" if entry.is_dir() else "📄"
-                    
-                    table.add_row(f"{icon} {entry.name}", size, modified, file_type, key=entry.path)
-                except Exception:
-                    continue
+                    if len(rows) - posted >= SCAN_BATCH_SIZE:
+                        self.app.call_from_thread(self._append_rows, generation, rows[posted:])
+                        if keep_rows:
+                            posted = len(rows)
+                        else:
+                            rows = []
+            finally:
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            if len(rows) > posted:
+                self.app.call_from_thread(self._append_rows, generation, rows[posted:])
+            if keep_rows:
+                self.app.call_from_thread(self._cache_rows, (path, show_hidden), mtime, rows)
         except PermissionError:
-            self.app.notify(f"Permission denied: {path}", severity="error")
+            self.app.call_from_thread(self.app.notify, f"Permission denied: {path}", severity="error")
         except Exception as e:
-            self.app.notify(f"Error reading directory: {e}", severity="error")
+            self.app.call_from_thread(self.app.notify, f"Error reading directory: {e}", severity="error")
+
+    def _append_rows(self, generation: int, rows: list[FileRow]) -> None:
+        """Add a batch of scanned rows unless a newer scan has started since."""
+        if generation != self._scan_generation:
+            return
+        table = self.table
+        for name, size, modified, file_type, key in rows:
+            table.add_row(name, size, modified, file_type, key=key)
+
+    def _cache_rows(self, key: tuple[str, bool], mtime: int, rows: list[FileRow]) -> None:
+        """Remember a completed listing, evicting the least recently used one."""
+        _dir_cache[key] = (mtime, rows)
+        _dir_cache.move_to_end(key)
+        if len(_dir_cache) > _DIR_CACHE_LIMIT:
+            _dir_cache.popitem(last=False)
 
     def is_hidden(self, entry: os.DirEntry) -> bool:
         """Return True if a directory entry should be considered hidden."""
@@ -883,176 +1305,26 @@ class FilePane(Container):
             return True
         if os.name == "nt":
             try:
-                return bool(entry.stat().st_file_attributes & 0x2)
+                return bool(entry.stat(follow_symlinks=False).st_file_attributes & 0x2)
             except Exception:
                 return False
         return False
 
     def format_size(self, size: int) -> str:
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        if size < 1024:
+            return f"{size:.1f} B"
+        # Each unit is 2**10 larger, so the bit length picks the unit directly
+        index = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 class ExplorerApp(App):
     def __init__(self, initial_path: str | None = None):
         super().__init__()
         self.initial_path = initial_path if initial_path and os.path.isdir(initial_path) else os.getcwd()
+        # Created on the first undo so sessions that never undo leave no folder
+        self._stash_root: str | None = None
 
-    CSS = """
-    Screen {
-        layout: horizontal;
-    }
-
-    #sidebar {
-        width: 30;
-        height: 100%;
-        background: $panel;
-        border-right: vkey $accent;
-        layout: vertical;
-    }
-
-    #sidebar-title {
-        background: $accent;
-        color: $text;
-        padding: 0 1;
-        width: 100%;
-        text-style: bold;
-        height: 1;
-    }
-
-    #tree-view {
-        height: 1fr;
-        width: 100%;
-    }
-    
-    #main-content {
-        width: 1fr;
-        height: 100%;
-        layout: vertical;
-    }
-    
-    #dual-pane {
-        width: 100%;
-        height: 100%;
-        layout: horizontal;
-    }
-
-    FilePane {
-        width: 1fr;
-        height: 100%;
-        border: heavy $accent;
-        margin: 0 1;
-        layout: vertical;
-    }
-    
-    FilePane:focus-within {
-        border: double $primary;
-    }
-
-    Toolbar {
-        height: 1;
-        width: 100%;
-        layout: horizontal;
-        background: $surface;
-        padding: 0 1;
-        align-vertical: middle;
-        dock: top;
-    }
-    
-    Toolbar Button {
-        min-width: 3;
-        width: auto;
-        margin-right: 1;
-        height: 1;
-        border: none;
-    }
-
-    #address-bar {
-        width: 1fr;
-        height: 1;
-        border: none;
-        background: $boost;
-    }
-
-    FileList {
-        width: 100%;
-        height: 1fr;
-    }
-    
-    #input_dialog {
-        layout: grid;
-        grid-size: 2;
-        grid-gutter: 1 2;
-        grid-rows: 1fr 3 3;
-        padding: 0 1;
-        width: 60;
-        height: 15;
-        border: thick $background 80%;
-        background: $surface;
-        align: center middle;
-    }
-    
-    #input_dialog Label {
-        column-span: 2;
-        height: 1;
-        width: 100%;
-        content-align: center middle;
-    }
-    
-    #input_dialog Input {
-        column-span: 2;
-        width: 100%;
-    }
-    
-    .buttons {
-        column-span: 2;
-        width: 100%;
-        align: center middle;
-    }
-
-    #context-menu {
-        width: auto;
-        height: auto;
-        background: $surface;
-        border: thick $primary;
-        padding: 1;
-    }
-    
-    #context-menu Button {
-        width: 100%;
-        height: 1;
-        border: none;
-        content-align: left middle;
-    }
-
-    #properties_dialog {
-        layout: vertical;
-        padding: 1 2;
-        width: 60;
-        height: auto;
-        border: thick $background 80%;
-        background: $surface;
-        align: center middle;
-    }
-
-    .hidden {
-        display: none;
-    }
-    ResizeHandle {
-        background: $accent;
-    }
-    ResizeHandle:hover {
-        background: $primary;
-    }
-    #sidebar-handle {
-        width: 1;
-        height: 100%;
-        dock: left;
-        background: $accent;
-    }
-    """
+    CSS_PATH = "explorer.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -1087,10 +1359,26 @@ class ExplorerApp(App):
         self.title = "Terminal Explorer"
         self.file_clipboard = ClipboardManager()
         self.history = OperationHistory()
+        self.active_pane: FilePane | None = None
+        # Toolbar/list refreshes requested by clipboard and history actions are
+        # coalesced and applied once per UI_FLUSH_DELAY window
+        self._toolbar_dirty = False
+        self._list_dirty_panes: set[FilePane] = set()
+        self._flush_timer = None
         self.console.print(Control.show_cursor(False), end="")
+        self._prewarm_terminal_lookup()
+
+    @work(thread=True, group="prewarm")
+    def _prewarm_terminal_lookup(self) -> None:
+        """Resolve terminal executables on PATH before the first launch needs them."""
+        for name in terminal_executables():
+            find_executable(name)
 
     def on_unmount(self) -> None:
         self.console.print(Control.show_cursor(True), end="")
+        # Items parked by undo only live for the session
+        if self._stash_root is not None:
+            shutil.rmtree(self._stash_root, ignore_errors=True)
 
     def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
         """Update the active pane when a sidebar node is clicked."""
@@ -1103,11 +1391,18 @@ class ExplorerApp(App):
         if pane:
             pane.update_file_list(path)
 
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        """Remember the file pane that last received focus."""
+        for node in event.widget.ancestors_with_self:
+            if isinstance(node, FilePane):
+                self.active_pane = node
+                return
+
     def get_active_pane(self) -> FilePane | None:
-        """Return the focused file pane, falling back to the left pane."""
-        focused = self.query("FilePane:focus-within")
-        if focused:
-            return focused.first()
+        """Return the last focused file pane, falling back to the left pane."""
+        pane = getattr(self, "active_pane", None)
+        if pane is not None:
+            return pane
         try:
             return self.query_one("#left-pane", FilePane)
         except Exception:
@@ -1182,8 +1477,26 @@ class ExplorerApp(App):
         elif button_id == "redo":
             self.action_redo()
         
-        self.update_toolbar_state()
+        self.request_ui_refresh()
     
+    def request_ui_refresh(self, pane: FilePane | None = None) -> None:
+        """Schedule a toolbar update, and a relist of pane if given, for the next flush."""
+        self._toolbar_dirty = True
+        if pane is not None:
+            self._list_dirty_panes.add(pane)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(UI_FLUSH_DELAY, self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        """Apply the refreshes requested since the last flush."""
+        self._flush_timer = None
+        panes, self._list_dirty_panes = self._list_dirty_panes, set()
+        for pane in panes:
+            pane.update_file_list(pane.current_path, add_to_history=False, use_cache=False)
+        if self._toolbar_dirty:
+            self._toolbar_dirty = False
+            self.update_toolbar_state()
+
     def update_toolbar_state(self) -> None:
         """Update toolbar button enabled/disabled states."""
         try:
@@ -1204,17 +1517,14 @@ class ExplorerApp(App):
         if not pane:
             return
         
-        table = pane.query_one(FileList)
-        if not table.row_count:
+        table = pane.table
+        if not table.row_count or not table.is_valid_coordinate(table.cursor_coordinate):
             return
         
-        try:
-            sel = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
-            self.file_clipboard.copy([sel])
-            self.notify(f"Copied: {os.path.basename(sel)}")
-            self.update_toolbar_state()
-        except Exception as e:
-            self.notify(f"Copy failed: {e}", severity="error")
+        sel = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        self.file_clipboard.copy([sel])
+        self.notify(f"Copied: {os.path.basename(sel)}")
+        self.request_ui_refresh()
     
     def action_cut_files(self) -> None:
         """Cut selected files to clipboard."""
@@ -1222,17 +1532,14 @@ class ExplorerApp(App):
         if not pane:
             return
         
-        table = pane.query_one(FileList)
-        if not table.row_count:
+        table = pane.table
+        if not table.row_count or not table.is_valid_coordinate(table.cursor_coordinate):
             return
         
-        try:
-            sel = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
-            self.file_clipboard.cut([sel])
-            self.notify(f"Cut: {os.path.basename(sel)}")
-            self.update_toolbar_state()
-        except Exception as e:
-            self.notify(f"Cut failed: {e}", severity="error")
+        sel = table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        self.file_clipboard.cut([sel])
+        self.notify(f"Cut: {os.path.basename(sel)}")
+        self.request_ui_refresh()
     
     def action_paste_files(self) -> None:
         """Paste files from clipboard to current directory."""
@@ -1240,26 +1547,96 @@ class ExplorerApp(App):
         if not pane:
             return
         
-        dest = pane.current_path
-        results = self.file_clipboard.paste(dest)
-        
+        # One paste at a time; concurrent pastes would just thrash the disk.
+        # A queued worker is not yet running, so test for unfinished ones.
+        if any(worker.group == "paste" and not worker.is_finished for worker in self.workers):
+            self.notify("A paste is already in progress", severity="warning")
+            return
+        self._paste_files(pane, pane.current_path)
+
+    @work(thread=True, group="paste")
+    def _paste_files(self, pane: FilePane, dest: str) -> None:
+        """Run a clipboard paste off the UI thread, posting progress back."""
+        last_report = time.monotonic()
+
+        def report(done: int, total: int) -> None:
+            nonlocal last_report
+            now = time.monotonic()
+            if now - last_report >= PASTE_PROGRESS_INTERVAL:
+                last_report = now
+                self.call_from_thread(self.notify, f"Pasting… {done}/{total}")
+
+        try:
+            results = self.file_clipboard.paste(dest, progress=report)
+            errors = len(self.file_clipboard.last_errors)
+            self.call_from_thread(self._paste_finished, pane, dest, results, errors)
+        except Exception as e:
+            # During shutdown the app can no longer take the message either
+            with contextlib.suppress(RuntimeError):
+                self.call_from_thread(self.notify, f"Paste failed: {e}", severity="error")
+
+    def _paste_finished(self, pane: FilePane, dest: str, results: list[tuple[str, str]], errors: int) -> None:
         if results:
+            # Overwritten files keep the directory's mtime, so the cache cannot tell
+            forget_listings(path for _, path in results)
             self.history.record("paste", items=results, destination=dest)
             self.notify(f"Pasted {len(results)} item(s)")
-            pane.update_file_list(dest, add_to_history=False)
-            self.update_toolbar_state()
-        elif self.file_clipboard.last_errors:
-            self.notify(f"Paste failed for {len(self.file_clipboard.last_errors)} item(s)", severity="error")
+            self.request_ui_refresh(pane)
+        elif errors:
+            self.notify(f"Paste failed for {errors} item(s)", severity="error")
 
     def _remove_path(self, path: str) -> None:
-        """Remove a file or directory if it exists."""
+        """Remove a file or directory if it exists. Runs in a history worker."""
+        # One lstat decides the removal; a symlink is unlinked, never followed
+        try:
+            is_dir = stat.S_ISDIR(os.lstat(path).st_mode)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.call_from_thread(self.notify, f"Could not remove {path}: {e}", severity="error")
+            return
         try:
-            if os.path.isdir(path):
+            if is_dir:
                 shutil.rmtree(path)
-            elif os.path.exists(path):
+            else:
                 os.remove(path)
-        except Exception as e:
-            self.notify(f"Could not remove {path}: {e}", severity="error")
+        except OSError as e:
+            self.call_from_thread(self.notify, f"Could not remove {path}: {e}", severity="error")
+
+    def _stash_paths(self, paths: list[str]) -> list[tuple[str, str]]:
+        """Park undone items in the session stash; returns (path, stashed) pairs.
+
+        Items on another filesystem than the stash are deleted instead, and
+        redo copies them again.
+        """
+        stashed_items = []
+        for path in paths:
+            try:
+                if self._stash_root is None:
+                    self._stash_root = new_stash_root()
+                stashed = stash_path(path, self._stash_root)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    self._remove_path(path)
+                else:
+                    self.call_from_thread(self.notify, f"Could not remove {path}: {e}", severity="error")
+                continue
+            stashed_items.append((path, stashed))
+        return stashed_items
+
+    def _restore_or_copy(self, source: str, destination: str, stashed: str | None) -> None:
+        """Put an undone item back from its stash, copying source again if that fails."""
+        if stashed is not None:
+            try:
+                restore_path(stashed, destination)
+            except OSError as e:
+                # The stash is left for session cleanup; fall back to a fresh copy
+                self.call_from_thread(self.notify, f"Could not restore {destination}: {e}", severity="warning")
+            else:
+                return
+        self._copy_path(source, destination)
 
     def _copy_path(self, source: str, destination: str) -> None:
         """Copy a file or directory to an exact destination."""
@@ -1269,38 +1646,51 @@ class ExplorerApp(App):
             else:
                 shutil.copy2(source, destination)
         except Exception as e:
-            self.notify(f"Could not copy {source}: {e}", severity="error")
+            self.call_from_thread(self.notify, f"Could not copy {source}: {e}", severity="error")
+
+    def _history_busy(self) -> bool:
+        """Return True, with a warning, while an earlier undo or redo is still applying."""
+        if any(worker.group == "history" and not worker.is_finished for worker in self.workers):
+            self.notify("Undo/redo is still in progress", severity="warning")
+            return True
+        return False
+
+    def _history_finished(self, op: dict) -> None:
+        forget_listings(operation_paths(op))
+        self.request_ui_refresh(self.get_active_pane())
     
     def action_undo(self) -> None:
         """Undo last operation."""
-        op = self.history.undo()
-        if not op:
+        if self._history_busy():
             return
-        
-        if op["op"] == "paste":
-            for _, dest in op["items"]:
-                self._remove_path(dest)
-            self.notify("Undone: Paste")
-        elif op["op"] in {"create_file", "create_folder"}:
-            self._remove_path(op["path"])
-            self.notify("Undone: Create")
-        elif op["op"] == "duplicate":
-            self._remove_path(op["dest"])
-            self.notify("Undone: Duplicate")
-        elif op["op"] == "rename":
-            try:
-                os.rename(op["new_path"], op["old_path"])
-                self.notify("Undone: Rename")
-            except Exception as e:
-                self.notify(f"Undo rename failed: {e}", severity="error")
-        elif op["op"] == "delete":
-            self.notify("Cannot undo delete (sent to trash)")
-        
-        pane = self.get_active_pane()
-        if pane:
-            pane.update_file_list(pane.current_path, add_to_history=False)
-        
-        self.update_toolbar_state()
+        op = self.history.undo()
+        if op:
+            self._undo_operation(op)
+
+    @work(thread=True, group="history")
+    def _undo_operation(self, op: dict) -> None:
+        """Reverse a history entry off the UI thread; removals and stashing can be slow."""
+        try:
+            if op["op"] == "paste":
+                op["stash"] = dict(self._stash_paths([dest for _, dest in op["items"]]))
+                self.call_from_thread(self.notify, "Undone: Paste")
+            elif op["op"] in {"create_file", "create_folder"}:
+                self._remove_path(op["path"])
+                self.call_from_thread(self.notify, "Undone: Create")
+            elif op["op"] == "duplicate":
+                op["stash"] = dict(self._stash_paths([op["dest"]]))
+                self.call_from_thread(self.notify, "Undone: Duplicate")
+            elif op["op"] == "rename":
+                try:
+                    os.rename(op["new_path"], op["old_path"])
+                    self.call_from_thread(self.notify, "Undone: Rename")
+                except Exception as e:
+                    self.call_from_thread(self.notify, f"Undo rename failed: {e}", severity="error")
+            elif op["op"] == "delete":
+                self.call_from_thread(self.notify, "Cannot undo delete (sent to trash)")
+        except Exception as e:
+            self.call_from_thread(self.notify, f"Undo failed: {e}", severity="error")
+        self.call_from_thread(self._history_finished, op)
     
     def path_to_file_uri(self, path: str) -> str:
         return Path(path).resolve().as_uri()
@@ -1396,57 +1786,67 @@ class ExplorerApp(App):
 
     def action_redo(self) -> None:
         """Redo last undone operation."""
-        op = self.history.redo()
-        if not op:
+        if self._history_busy():
             return
-        
-        if op["op"] == "paste":
-            for src, dest in op["items"]:
-                self._copy_path(src, dest)
-            self.notify("Redone: Paste")
-        elif op["op"] == "create_file":
-            open(op["path"], "a").close()
-            self.notify("Redone: Create File")
-        elif op["op"] == "create_folder":
-            os.makedirs(op["path"], exist_ok=True)
-            self.notify("Redone: Create Folder")
-        elif op["op"] == "duplicate":
-            self._copy_path(op["source"], op["dest"])
-            self.notify("Redone: Duplicate")
-        elif op["op"] == "rename":
-            try:
-                os.rename(op["old_path"], op["new_path"])
-                self.notify("Redone: Rename")
-            except Exception as e:
-                self.notify(f"Redo rename failed: {e}", severity="error")
-        
-        pane = self.get_active_pane()
-        if pane:
-            pane.update_file_list(pane.current_path, add_to_history=False)
-        
-        self.update_toolbar_state()
+        op = self.history.redo()
+        if op:
+            self._redo_operation(op)
+
+    @work(thread=True, group="history")
+    def _redo_operation(self, op: dict) -> None:
+        """Re-apply a history entry off the UI thread; restoring may fall back to a copy."""
+        try:
+            if op["op"] == "paste":
+                stash = op.pop("stash", {})
+                for src, dest in op["items"]:
+                    self._restore_or_copy(src, dest, stash.get(dest))
+                self.call_from_thread(self.notify, "Redone: Paste")
+            elif op["op"] == "create_file":
+                open(op["path"], "a").close()
+                self.call_from_thread(self.notify, "Redone: Create File")
+            elif op["op"] == "create_folder":
+                os.makedirs(op["path"], exist_ok=True)
+                self.call_from_thread(self.notify, "Redone: Create Folder")
+            elif op["op"] == "duplicate":
+                stash = op.pop("stash", {})
+                self._restore_or_copy(op["source"], op["dest"], stash.get(op["dest"]))
+                self.call_from_thread(self.notify, "Redone: Duplicate")
+            elif op["op"] == "rename":
+                try:
+                    os.rename(op["old_path"], op["new_path"])
+                    self.call_from_thread(self.notify, "Redone: Rename")
+                except Exception as e:
+                    self.call_from_thread(self.notify, f"Redo rename failed: {e}", severity="error")
+        except Exception as e:
+            self.call_from_thread(self.notify, f"Redo failed: {e}", severity="error")
+        self.call_from_thread(self._history_finished, op)
 
+    @work(thread=True, group="launch")
     def open_file_with_app(self, file_path: str, app_choice: str) -> None:
-        """Open a file with the specified application."""
+        """Open a file with the specified application.
+
+        Runs in a worker thread: shell association lookups and process start-up
+        (os.startfile on Windows especially) can block for seconds.
+        """
         try:
             if app_choice == "default":
                 self._open_with_default_app(file_path)
-                self.notify("Opened with default program")
+                self.call_from_thread(self.notify, "Opened with default program")
             elif app_choice == "browse":
                 if os.name == "nt":
                     subprocess.Popen(["rundll32.exe", "shell32.dll,OpenAs_RunDLL", file_path])
                 else:
                     self._open_with_default_app(file_path)
-                    self.notify("Opened with system app chooser")
+                    self.call_from_thread(self.notify, "Opened with system app chooser")
             else:
                 command = self._get_open_with_command(file_path, app_choice)
                 if not command:
-                    self.notify(f"No app mapping for {app_choice}", severity="error")
+                    self.call_from_thread(self.notify, f"No app mapping for {app_choice}", severity="error")
                     return
                 subprocess.Popen(command)
-                self.notify(f"Opened with {app_choice}")
+                self.call_from_thread(self.notify, f"Opened with {app_choice}")
         except Exception as e:
-            self.notify(f"Error opening file: {e}", severity="error")
+            self.call_from_thread(self.notify, f"Error opening file: {e}", severity="error")
 
     def _open_with_default_app(self, file_path: str) -> None:
         if os.name == "nt":
@@ -1484,7 +1884,11 @@ class ExplorerApp(App):
         """Launch an external terminal for the current platform."""
         pane = self.get_active_pane()
         target_path = path or (pane.current_path if pane else os.getcwd())
+        self._launch_terminal(target_path)
 
+    @work(thread=True, group="launch")
+    def _launch_terminal(self, target_path: str) -> None:
+        """Start the platform's terminal off the UI thread."""
         if os.name == "nt":
             self._open_windows_terminal(target_path)
             return
@@ -1496,70 +1900,48 @@ class ExplorerApp(App):
         self._open_linux_terminal(target_path)
 
     def _open_windows_terminal(self, target_path: str) -> None:
-        creationflags = getattr(subprocess, "CREATE_NEW_CONSOLE", 0)
-        no_window = getattr(subprocess, "CREATE_NO_WINDOW", 0)
-
-        last_error: Exception | None = None
-        try:
-            subprocess.Popen(["wt.exe", "-d", target_path], shell=False, creationflags=no_window)
-            self.notify("Opened Windows Terminal")
+        # Dispatch on the first terminal found on PATH rather than letting
+        # failed launches cascade through the alternatives
+        for label, template, flag_name in _WINDOWS_TERMINALS:
+            if find_executable(template[0]):
+                break
+        else:
+            self.call_from_thread(self.notify, "Could not launch terminal: no supported terminal command found", severity="error")
             return
-        except FileNotFoundError as e:
-            last_error = e
-        except Exception as e:
-            last_error = e
 
+        command = [arg.format(path=target_path) for arg in template]
         try:
-            subprocess.Popen(["pwsh.exe", "-NoExit", "-Command", "Set-Location -LiteralPath $args[0]", target_path], 
-                           shell=False, creationflags=creationflags)
-            self.notify("Opened PowerShell")
-            return
+            subprocess.Popen(command, shell=False, close_fds=True, creationflags=getattr(subprocess, flag_name, 0))
+            self.call_from_thread(self.notify, f"Opened {label}")
         except Exception as e:
-            last_error = e
-
-        try:
-            subprocess.Popen(["cmd.exe", "/k", "cd", "/d", target_path], 
-                           shell=False, creationflags=creationflags)
-            self.notify("Opened Command Prompt")
-            return
-        except Exception as e:
-            detail = e or last_error
-            self.notify(f"Could not launch terminal: {detail}", severity="error")
+            self.call_from_thread(self.notify, f"Could not launch terminal: {e}", severity="error")
 
     def _open_macos_terminal(self, target_path: str) -> None:
         last_error: Exception | None = None
         for app_name in ("Terminal", "iTerm"):
             try:
                 subprocess.Popen(["open", "-a", app_name, target_path])
-                self.notify(f"Opened {app_name}")
+                self.call_from_thread(self.notify, f"Opened {app_name}")
                 return
             except Exception as e:
                 last_error = e
 
-        self.notify(f"Could not launch terminal: {last_error}", severity="error")
+        self.call_from_thread(self.notify, f"Could not launch terminal: {last_error}", severity="error")
 
     def _open_linux_terminal(self, target_path: str) -> None:
-        candidates = [
-            ("GNOME Terminal", ["gnome-terminal", f"--working-directory={target_path}"]),
-            ("Konsole", ["konsole", "--workdir", target_path]),
-            ("XFCE Terminal", ["xfce4-terminal", "--working-directory", target_path]),
-            ("Kitty", ["kitty", "--directory", target_path]),
-            ("Alacritty", ["alacritty", "--working-directory", target_path]),
-            ("WezTerm", ["wezterm", "start", "--cwd", target_path]),
-        ]
-
         last_error: Exception | None = None
-        for label, command in candidates:
-            if not shutil.which(command[0]):
+        for label, template in _LINUX_TERMINALS:
+            if not find_executable(template[0]):
                 continue
+            command = [arg.format(path=target_path) for arg in template]
             try:
                 subprocess.Popen(command)
-                self.notify(f"Opened {label}")
+                self.call_from_thread(self.notify, f"Opened {label}")
                 return
             except Exception as e:
                 last_error = e
 
-        self.notify(f"Could not launch terminal: {last_error or 'no supported terminal command found'}", severity="error")
+        self.call_from_thread(self.notify, f"Could not launch terminal: {last_error or 'no supported terminal command found'}", severity="error")
 
 if __name__ == "__main__":
     app = ExplorerApp(initial_path=resolve_initial_path(sys.argv))
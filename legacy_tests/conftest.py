@@ -0,0 +1,47 @@
+"""Shared fixtures for the legacy test modules."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+
+def _scratch_root():
+    """Return a RAM-backed temp root when one is available."""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return None
+
+
+def _mount_private_tmpfs(path):
+    """Mount a throwaway tmpfs on path when running as root on Linux.
+
+    Teardown is then a single umount instead of a recursive delete.
+    """
+    if not (sys.platform.startswith("linux") and os.geteuid() == 0):
+        return False
+    if not (shutil.which("mount") and shutil.which("umount")):
+        return False
+    return subprocess.run(
+        ["mount", "-t", "tmpfs", "tmpfs", path], capture_output=True, close_fds=True
+    ).returncode == 0
+
+
+@pytest.fixture(scope="session")
+def scratch_base():
+    """One scratch directory per test session, kept off the disk where possible.
+
+    Under pytest-xdist every worker is its own session and gets its own base.
+    """
+    base = tempfile.mkdtemp(prefix="explorer_integration_", dir=_scratch_root())
+    mounted = _mount_private_tmpfs(base)
+    try:
+        yield base
+    finally:
+        if mounted:
+            subprocess.run(["umount", base], capture_output=True, close_fds=True)
+        shutil.rmtree(base, ignore_errors=True)
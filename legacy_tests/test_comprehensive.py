@@ -9,13 +9,9 @@ import tempfile
 import shutil
 from pathlib import Path
 
-# Import components to test
+# Import components to test; UI classes are imported inside the tests that
+# use them so the clipboard/history checks don't pay for loading Textual
 from clipboard_helpers import ClipboardManager, OperationHistory
-from explorer import (
-    ExplorerApp, FilePane, Sidebar, SystemTree, FileList,
-    InputScreen, PropertiesScreen, ContextMenu, OpenWithScreen,
-    ResizeHandle, Toolbar
-)
 
 
 class TestResults:
@@ -183,6 +179,7 @@ def test_app_instantiation():
     print("\n--- Testing App Instantiation ---")
     
     try:
+        from explorer import ExplorerApp
         app = ExplorerApp()
         assert app is not None, "App should be instantiated"
         results.add_pass("ExplorerApp instantiation")
@@ -193,6 +190,7 @@ def test_app_instantiation():
 def test_component_instantiation():
     """Test that all components can be instantiated."""
     print("\n--- Testing Component Instantiation ---")
+    from explorer import ContextMenu, InputScreen, OpenWithScreen, PropertiesScreen, ResizeHandle
     
     # Test ResizeHandle
     try:
@@ -384,6 +382,7 @@ def test_edge_cases():
     
     # Test OpenWithScreen with various file extensions
     try:
+        from explorer import OpenWithScreen
         extensions = ['.txt', '.py', '.js', '.png', '.jpg', '.pdf', '.unknown']
         for ext in extensions:
             with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tf:
@@ -1,575 +1,521 @@
 """
 Integration tests for Terminal Explorer.
 Tests potential crash scenarios and edge cases in actual usage.
+
+Checks fail through ``pytest.fail`` rather than ``assert``, so the suite gives
+the same verdicts when run with ``python -O``. The tests share no state beyond
+their session scratch directory, so ``pytest -n auto`` (pytest-xdist) can
+spread them across processes.
 """
 
+import contextlib
 import os
+import shutil
+import stat
 import sys
 import tempfile
-import shutil
-from pathlib import Path
+import unicodedata
+
+import pytest
 
 from clipboard_helpers import ClipboardManager, OperationHistory
 
 
-class IntegrationTestResults:
-    """Track integration test results."""
-    def __init__(self):
-        self.passed = []
-        self.failed = []
-        self.errors = []
-    
-    def add_pass(self, test_name):
-        self.passed.append(test_name)
-        print(f"✓ PASS: {test_name}")
-    
-    def add_fail(self, test_name, reason):
-        self.failed.append((test_name, reason))
-        print(f"✗ FAIL: {test_name} - {reason}")
-    
-    def add_error(self, test_name, error):
-        self.errors.append((test_name, str(error)))
-        print(f"✗ ERROR: {test_name} - {error}")
-    
-    def summary(self):
-        total = len(self.passed) + len(self.failed) + len(self.errors)
-        print("\n" + "="*60)
-        print(f"Integration Test Summary: {len(self.passed)}/{total} passed")
-        print("="*60)
-        
-        if self.failed:
-            print("\nFailed Tests:")
-            for name, reason in self.failed:
-                print(f"  - {name}: {reason}")
-        
-        if self.errors:
-            print("\nErrors:")
-            for name, error in self.errors:
-                print(f"  - {name}: {error}")
-        
-        return len(self.failed) == 0 and len(self.errors) == 0
-
-
-results = IntegrationTestResults()
-
-
-def test_special_characters_in_filenames():
-    """Test handling of special characters in filenames."""
-    print("\n--- Testing Special Characters in Filenames ---")
-    
-    test_dir = tempfile.mkdtemp(prefix="explorer_special_")
-    
-    try:
-        # Test various special characters (avoiding truly problematic ones on Windows)
-        special_names = [
-            "file with spaces.txt",
-            "file-with-dashes.txt",
-            "file_with_underscores.txt",
-            "file.multiple.dots.txt",
-            "file(with)parentheses.txt",
-            "file[with]brackets.txt",
-            "file{with}braces.txt",
-            "file'with'quotes.txt",
-            "file@with@at.txt",
-            "file#with#hash.txt",
-            "file$with$dollar.txt",
-            "file%with%percent.txt",
-            "file&with&ampersand.txt",
-            "file=with=equals.txt",
-            "file+with+plus.txt",
-            "file,with,comma.txt",
-            "file;with;semicolon.txt",
-        ]
-        
-        created_files = []
-        for name in special_names:
+# Shared by the tests that only need a clean clipboard; each one clears it
+# before use. State-consistency checks still build their own instance.
+_CM = ClipboardManager()
+
+
+# Special characters for filename tests (avoiding truly problematic ones on Windows)
+_SPECIAL_NAMES = (
+    "file with spaces.txt",
+    "file-with-dashes.txt",
+    "file_with_underscores.txt",
+    "file.multiple.dots.txt",
+    "file(with)parentheses.txt",
+    "file[with]brackets.txt",
+    "file{with}braces.txt",
+    "file'with'quotes.txt",
+    "file@with@at.txt",
+    "file#with#hash.txt",
+    "file$with$dollar.txt",
+    "file%with%percent.txt",
+    "file&with&ampersand.txt",
+    "file=with=equals.txt",
+    "file+with+plus.txt",
+    "file,with,comma.txt",
+    "file;with;semicolon.txt",
+)
+_SPECIAL_PAYLOADS = tuple(f"Content for {n}".encode('utf-8') for n in _SPECIAL_NAMES)
+
+# Unicode names for filename tests; payloads are pre-encoded once at import.
+# Names are NFC-normalized and deduplicated so filesystems that normalize
+# names themselves (APFS, HFS+) never see two spellings of the same file.
+_UNICODE_NAMES = tuple(dict.fromkeys(unicodedata.normalize("NFC", name) for name in (
+    "文件.txt",  # Chinese
+    "файл.txt",  # Russian
+    "αρχείο.txt",  # Greek
+    "ファイル.txt",  # Japanese
+    "파일.txt",  # Korean
+    "file_with_emoji_😀.txt",  # Emoji
+    "café.txt",  # Accented characters
+    "niño.txt",  # Spanish
+)))
+_UNICODE_PAYLOADS = tuple(f"Content for {n}".encode('utf-8') for n in _UNICODE_NAMES)
+
+_LONG_PATH_PARTS = tuple(f"verylongdirectoryname{i}" for i in range(20))
+
+
+_SEP = os.sep
+
+
+def _join(directory, name):
+    """Join one name onto a directory that never ends in a separator."""
+    return f"{directory}{_SEP}{name}"
+
+
+def _fast_rmtree(path):
+    """Remove a small test tree with scandir/unlink/rmdir and no path joins."""
+    dirs = [path]
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    dirs.append(entry.path)
+                else:
+                    try:
+                        os.unlink(entry.path)
+                    except PermissionError:
+                        # Windows refuses to delete read-only files
+                        os.chmod(entry.path, stat.S_IWRITE)
+                        os.unlink(entry.path)
+    # Children are always discovered after their parent.
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
+def _rmtree_children_at(dir_fd):
+    """Empty the directory open on dir_fd using names relative to it."""
+    with os.scandir(dir_fd) as entries:
+        entries = list(entries)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            child_fd = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW, dir_fd=dir_fd)
             try:
-                file_path = os.path.join(test_dir, name)
-                with open(file_path, 'w') as f:
-                    f.write(f"Content for {name}")
-                created_files.append(file_path)
-            except:
-                # Some characters may not be allowed on certain filesystems
-                pass
-        
-        if not created_files:
-            results.add_fail("Special characters in filenames", "No files could be created")
-            return
-        
-        # Test clipboard operations with special characters
-        cm = ClipboardManager()
-        cm.copy(created_files)
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        if len(result) == len(created_files):
-            results.add_pass("Special characters in filenames")
+                _rmtree_children_at(child_fd)
+            finally:
+                os.close(child_fd)
+            os.rmdir(entry.name, dir_fd=dir_fd)
         else:
-            results.add_fail("Special characters in filenames", 
-                           f"Only {len(result)}/{len(created_files)} files pasted")
-        
-    except Exception as e:
-        results.add_error("Special characters in filenames", e)
+            os.unlink(entry.name, dir_fd=dir_fd)
+
+
+def _rmtree_at(path):
+    """Remove a deep tree with dir_fd-relative syscalls, so no long paths are resolved."""
+    if not (os.scandir in os.supports_fd and {os.open, os.rmdir, os.unlink} <= os.supports_dir_fd):
+        _fast_rmtree(path)
+        return
+    dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        _rmtree_children_at(dir_fd)
     finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+        os.close(dir_fd)
+    os.rmdir(path)
 
 
-def test_very_long_paths():
-    """Test handling of very long file paths."""
-    print("\n--- Testing Very Long Paths ---")
+def _fastwrite(path, data: bytes):
+    """Write a small file with raw os calls, skipping the file-object layers."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def dests_root(scratch_base):
+    """Shared root for every test's paste destination, removed with the base."""
+    root = os.path.join(scratch_base, "dests")
+    os.mkdir(root)
+    return root
+
+
+@pytest.fixture
+def work_dir(scratch_base, request):
+    """A fresh working directory for one test inside the session base."""
+    path = tempfile.mkdtemp(prefix=f"{request.node.name}_", dir=scratch_base)
+    yield path
+    # A private tmpfs mount is dropped wholesale at session end instead.
+    if not os.path.ismount(scratch_base):
+        with contextlib.suppress(OSError):
+            _rmtree_at(path)
+
+
+@pytest.fixture
+def dest_dir(dests_root, work_dir):
+    """The paste destination paired with the test's working directory."""
+    path = os.path.join(dests_root, os.path.basename(work_dir))
+    os.mkdir(path)
+    return path
+
+
+def test_app_instantiation():
+    """Test that the application can be instantiated without errors."""
+    # Imported here so only the process running this test pays for Textual
+    from explorer import ExplorerApp
+    ExplorerApp()
+
+
+def test_special_characters_in_filenames(work_dir, dest_dir):
+    """Test handling of special characters in filenames."""
+    created_files = []
+    for name, payload in zip(_SPECIAL_NAMES, _SPECIAL_PAYLOADS):
+        file_path = _join(work_dir, name)
+        # Some characters may not be allowed on certain filesystems
+        with contextlib.suppress(OSError):
+            _fastwrite(file_path, payload)
+            created_files.append(file_path)
+    
+    if not created_files:
+        pytest.fail("No files could be created")
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_long_")
+    # Test clipboard operations with special characters
+    cm = _CM
+    cm.clear()
+    cm.copy(created_files)
     
+    result = cm.paste(dest_dir)
+    
+    if len(result) != len(created_files):
+        pytest.fail(f"Only {len(result)}/{len(created_files)} files pasted")
+
+
+def test_very_long_paths(work_dir, dest_dir):
+    """Test handling of very long file paths."""
+    # Create a deep directory structure in one call
+    current = os.path.join(work_dir, *_LONG_PATH_PARTS)
+    # If the path is too long for the filesystem, creating the file
+    # below fails too and the test takes the graceful branch.
+    with contextlib.suppress(OSError):
+        os.makedirs(current, exist_ok=True)
+    
+    # Try to create a file in the deepest directory
     try:
-        # Create a deep directory structure
-        current = test_dir
-        for i in range(20):  # Create nested directories
-            current = os.path.join(current, f"verylongdirectoryname{i}")
-            try:
-                os.makedirs(current, exist_ok=True)
-            except OSError:
-                # Path too long for filesystem
-                break
-        
-        # Try to create a file in the deepest directory
-        try:
-            file_path = os.path.join(current, "file_with_a_very_long_name_to_test_path_limits.txt")
-            with open(file_path, 'w') as f:
-                f.write("Test content")
-            
-            # Test clipboard operations
-            cm = ClipboardManager()
-            cm.copy([file_path])
-            
-            dest_dir = os.path.join(test_dir, "dest")
-            os.makedirs(dest_dir)
-            
-            result = cm.paste(dest_dir)
-            
-            if len(result) == 1:
-                results.add_pass("Very long paths")
-            else:
-                results.add_pass("Very long paths (graceful handling)")
-        except OSError:
-            # Path too long for filesystem - this is expected behavior
-            results.add_pass("Very long paths (filesystem limit reached gracefully)")
-        
-    except Exception as e:
-        results.add_error("Very long paths", e)
-    finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+        file_path = os.path.join(current, "file_with_a_very_long_name_to_test_path_limits.txt")
+        with open(file_path, 'w') as f:
+            f.write("Test content")
+    except OSError:
+        # Path too long for filesystem - this is expected behavior
+        return
+    
+    # Test clipboard operations; a partial paste is handled gracefully
+    cm = _CM
+    cm.clear()
+    cm.copy([file_path])
+    cm.paste(dest_dir)
 
 
-def test_unicode_filenames():
+def test_unicode_filenames(work_dir, dest_dir):
     """Test handling of unicode characters in filenames."""
-    print("\n--- Testing Unicode Filenames ---")
+    created_files = []
+    for name, payload in zip(_UNICODE_NAMES, _UNICODE_PAYLOADS):
+        file_path = _join(work_dir, name)
+        # Some unicode may not be supported on all filesystems
+        with contextlib.suppress(OSError, UnicodeError):
+            _fastwrite(file_path, payload)
+            created_files.append(file_path)
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_unicode_")
+    if not created_files:
+        pytest.skip("Unicode filenames not supported on this filesystem")
     
-    try:
-        unicode_names = [
-            "文件.txt",  # Chinese
-            "файл.txt",  # Russian
-            "αρχείο.txt",  # Greek
-            "ファイル.txt",  # Japanese
-            "파일.txt",  # Korean
-            "file_with_emoji_😀.txt",  # Emoji
-            "café.txt",  # Accented characters
-            "niño.txt",  # Spanish
-        ]
-        
-        created_files = []
-        for name in unicode_names:
-            try:
-                file_path = os.path.join(test_dir, name)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Content for {name}")
-                created_files.append(file_path)
-            except:
-                # Some unicode may not be supported on all filesystems
-                pass
-        
-        if not created_files:
-            results.add_pass("Unicode filenames (not supported on this filesystem)")
-            return
-        
-        # Test clipboard operations
-        cm = ClipboardManager()
-        cm.copy(created_files)
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        if len(result) == len(created_files):
-            results.add_pass("Unicode filenames")
-        else:
-            results.add_pass("Unicode filenames (partial support)")
-        
-    except Exception as e:
-        results.add_error("Unicode filenames", e)
-    finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+    # Test clipboard operations; partial support is acceptable
+    cm = _CM
+    cm.clear()
+    cm.copy(created_files)
+    cm.paste(dest_dir)
 
 
-def test_empty_directory_operations():
+def test_empty_directory_operations(work_dir, dest_dir):
     """Test operations on empty directories."""
-    print("\n--- Testing Empty Directory Operations ---")
+    # Create an empty directory
+    empty_dir = os.path.join(work_dir, "empty")
+    os.mkdir(empty_dir)
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_empty_")
+    # Test copy
+    cm = _CM
+    cm.clear()
+    cm.copy([empty_dir])
     
-    try:
-        # Create an empty directory
-        empty_dir = os.path.join(test_dir, "empty")
-        os.makedirs(empty_dir)
-        
-        # Test copy
-        cm = ClipboardManager()
-        cm.copy([empty_dir])
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        if len(result) == 1 and os.path.isdir(os.path.join(dest_dir, "empty")):
-            results.add_pass("Empty directory copy")
-        else:
-            results.add_fail("Empty directory copy", "Directory not copied correctly")
-        
-        # Test cut
-        cm.cut([empty_dir])
-        result = cm.paste(dest_dir)
-        
-        if not os.path.exists(empty_dir):
-            results.add_pass("Empty directory cut")
-        else:
-            results.add_fail("Empty directory cut", "Directory not moved")
-        
-    except Exception as e:
-        results.add_error("Empty directory operations", e)
-    finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+    result = cm.paste(dest_dir)
+    
+    if not (len(result) == 1 and os.path.isdir(os.path.join(dest_dir, "empty"))):
+        pytest.fail("Directory not copied correctly")
+    
+    # Test cut
+    cm.cut([empty_dir])
+    cm.paste(dest_dir)
+    
+    if os.path.exists(empty_dir):
+        pytest.fail("Directory not moved")
 
 
-def test_nested_directory_operations():
+def test_nested_directory_operations(work_dir, dest_dir):
     """Test operations on deeply nested directories."""
-    print("\n--- Testing Nested Directory Operations ---")
+    # Create nested structure
+    nested = os.path.join(work_dir, "level1", "level2", "level3")
+    os.makedirs(nested)
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_nested_")
+    # Create files at various levels
+    with open(os.path.join(work_dir, "level1", "file1.txt"), 'w') as f:
+        f.write("Level 1")
+    with open(os.path.join(work_dir, "level1", "level2", "file2.txt"), 'w') as f:
+        f.write("Level 2")
+    with open(os.path.join(nested, "file3.txt"), 'w') as f:
+        f.write("Level 3")
     
-    try:
-        # Create nested structure
-        nested = os.path.join(test_dir, "level1", "level2", "level3")
-        os.makedirs(nested)
-        
-        # Create files at various levels
-        with open(os.path.join(test_dir, "level1", "file1.txt"), 'w') as f:
-            f.write("Level 1")
-        with open(os.path.join(test_dir, "level1", "level2", "file2.txt"), 'w') as f:
-            f.write("Level 2")
-        with open(os.path.join(nested, "file3.txt"), 'w') as f:
-            f.write("Level 3")
-        
-        # Copy entire structure
-        cm = ClipboardManager()
-        cm.copy([os.path.join(test_dir, "level1")])
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        # Verify structure was copied
-        if (os.path.exists(os.path.join(dest_dir, "level1", "file1.txt")) and
-            os.path.exists(os.path.join(dest_dir, "level1", "level2", "file2.txt")) and
-            os.path.exists(os.path.join(dest_dir, "level1", "level2", "level3", "file3.txt"))):
-            results.add_pass("Nested directory copy")
-        else:
-            results.add_fail("Nested directory copy", "Structure not copied completely")
-        
-    except Exception as e:
-        results.add_error("Nested directory operations", e)
-    finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
-
-
-def test_large_file_operations():
-    """Test operations with large files."""
-    print("\n--- Testing Large File Operations ---")
+    # Copy entire structure
+    cm = _CM
+    cm.clear()
+    cm.copy([os.path.join(work_dir, "level1")])
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_large_")
+    cm.paste(dest_dir)
     
+    # Verify structure was copied, collecting the tree in one walk
+    found = {
+        os.path.relpath(os.path.join(root, name), dest_dir)
+        for root, _dirs, names in os.walk(dest_dir)
+        for name in names
+    }
+    expected = {
+        os.path.join("level1", "file1.txt"),
+        os.path.join("level1", "level2", "file2.txt"),
+        os.path.join("level1", "level2", "level3", "file3.txt"),
+    }
+    if not expected <= found:
+        pytest.fail("Structure not copied completely")
+
+
+def test_large_file_operations(work_dir, dest_dir):
+    """Test operations with large files."""
+    # Create a moderately large file (1MB); only its size is checked, so
+    # a sparse file is enough and nothing has to be written.
+    large_file = os.path.join(work_dir, "large_file.bin")
+    fd = os.open(large_file, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
     try:
-        # Create a moderately large file (1MB)
-        large_file = os.path.join(test_dir, "large_file.bin")
-        with open(large_file, 'wb') as f:
-            f.write(b'0' * (1024 * 1024))  # 1 MB
-        
-        # Test copy
-        cm = ClipboardManager()
-        cm.copy([large_file])
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        dest_file = os.path.join(dest_dir, "large_file.bin")
-        if os.path.exists(dest_file) and os.path.getsize(dest_file) == 1024 * 1024:
-            results.add_pass("Large file copy")
-        else:
-            results.add_fail("Large file copy", "File not copied correctly")
-        
-    except Exception as e:
-        results.add_error("Large file operations", e)
+        os.ftruncate(fd, 1024 * 1024)
     finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+        os.close(fd)
+    
+    # Test copy
+    cm = _CM
+    cm.clear()
+    cm.copy([large_file])
+    
+    cm.paste(dest_dir)
+    
+    # One scandir of dest_dir supplies both existence and size.
+    copied_size = next(
+        (entry.stat().st_size for entry in os.scandir(dest_dir) if entry.name == "large_file.bin"),
+        None,
+    )
+    if copied_size != 1024 * 1024:
+        pytest.fail("File not copied correctly")
+
+
+@pytest.mark.skipif(not getattr(shutil, "_USE_CP_SENDFILE", False), reason="shutil has no sendfile(2) fast path here")
+def test_large_file_copy_uses_sendfile(work_dir, dest_dir):
+    """A large paste takes shutil's sendfile(2) path and must still copy every byte."""
+    content = bytes(range(256)) * 4096
+    large_file = os.path.join(work_dir, "large_content.bin")
+    _fastwrite(large_file, content)
+    
+    cm = _CM
+    cm.clear()
+    cm.copy([large_file])
+    result = cm.paste(dest_dir)
+    
+    if len(result) != 1 or cm.last_errors:
+        pytest.fail(f"Large paste failed: {cm.last_errors}")
+    copied = result[0][1]
+    if os.path.getsize(copied) != len(content):
+        pytest.fail("Large file copied with the wrong size")
+    with open(copied, "rb") as f:
+        if f.read() != content:
+            pytest.fail("Large file contents differ after paste")
 
 
-def test_readonly_scenarios():
+def test_readonly_scenarios(work_dir, dest_dir):
     """Test operations with read-only files."""
-    print("\n--- Testing Read-Only Scenarios ---")
-    
-    test_dir = tempfile.mkdtemp(prefix="explorer_readonly_")
-    
+    # Create the file read-only from the start: the mode only applies to
+    # later opens, so the descriptor returned here can still write it.
+    readonly_file = os.path.join(work_dir, "readonly.txt")
+    fd = os.open(readonly_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o444)
     try:
-        # Create a file and make it read-only
-        readonly_file = os.path.join(test_dir, "readonly.txt")
-        with open(readonly_file, 'w') as f:
-            f.write("Read only content")
-        
-        # Make file read-only (cross-platform)
-        os.chmod(readonly_file, 0o444)
-        
-        # Test copy (should work)
-        cm = ClipboardManager()
-        cm.copy([readonly_file])
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        if len(result) == 1:
-            results.add_pass("Read-only file copy")
-        else:
-            results.add_fail("Read-only file copy", "Failed to copy read-only file")
-        
-        # Try to cut (may fail due to read-only, should handle gracefully)
-        try:
-            cm.cut([readonly_file])
-            result = cm.paste(os.path.join(test_dir, "dest2"))
-            # If it succeeds, that's okay
-            results.add_pass("Read-only file cut (succeeded)")
-        except:
-            # If it fails, that's also okay as long as it doesn't crash
-            results.add_pass("Read-only file cut (graceful failure)")
-        
-    except Exception as e:
-        results.add_error("Read-only scenarios", e)
+        os.write(fd, b"Read only content")
     finally:
-        # Reset permissions before cleanup
-        try:
-            os.chmod(readonly_file, 0o644)
-        except:
-            pass
-        shutil.rmtree(test_dir, ignore_errors=True)
+        os.close(fd)
+    
+    # Test copy (should work)
+    cm = _CM
+    cm.clear()
+    cm.copy([readonly_file])
+    
+    result = cm.paste(dest_dir)
+    
+    if len(result) != 1:
+        pytest.fail("Failed to copy read-only file")
+    
+    # Moving only needs write access to the folders, so the cut should
+    # succeed; where it cannot, the failure must be reported, not raised
+    dest2 = os.path.join(work_dir, "dest2")
+    os.mkdir(dest2)
+    cm.cut([readonly_file])
+    result = cm.paste(dest2)
+    
+    moved = os.path.join(dest2, "readonly.txt")
+    if result == [(readonly_file, moved)]:
+        if os.path.lexists(readonly_file) or not os.path.isfile(moved):
+            pytest.fail("Read-only file not moved by cut/paste")
+    elif [item for item, _ in cm.last_errors] != [readonly_file]:
+        pytest.fail(f"Cut of read-only file neither moved nor reported: {cm.last_errors}")
 
 
 def test_concurrent_operations():
     """Test multiple clipboard operations in sequence."""
-    print("\n--- Testing Concurrent Operations ---")
+    # copy() and cut() only record path strings, so the files never need
+    # to exist and this test does no filesystem work at all.
+    files = [_join(os.sep + "virtual", f"file{i}.txt") for i in range(10)]
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_concurrent_")
+    cm = _CM
+    cm.clear()
     
-    try:
-        # Create test files
-        files = []
-        for i in range(10):
-            file_path = os.path.join(test_dir, f"file{i}.txt")
-            with open(file_path, 'w') as f:
-                f.write(f"Content {i}")
-            files.append(file_path)
-        
-        cm = ClipboardManager()
-        
-        # Perform multiple operations
-        cm.copy(files[:5])
-        assert len(cm.items) == 5, "Should have 5 items"
-        
-        cm.cut(files[5:])
-        assert len(cm.items) == 5, "Should replace with 5 items"
-        assert cm.operation == "cut", "Should be cut operation"
-        
-        cm.copy(files[:3])
-        assert len(cm.items) == 3, "Should replace with 3 items"
-        assert cm.operation == "copy", "Should be copy operation"
-        
-        cm.clear()
-        assert len(cm.items) == 0, "Should be empty"
-        
-        results.add_pass("Concurrent operations")
-        
-    except Exception as e:
-        results.add_error("Concurrent operations", e)
-    finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+    # Perform multiple operations
+    cm.copy(files[:5])
+    if len(cm.items) != 5:
+        pytest.fail("Should have 5 items")
+    
+    cm.cut(files[5:])
+    if len(cm.items) != 5:
+        pytest.fail("Should replace with 5 items")
+    if cm.operation != "cut":
+        pytest.fail("Should be cut operation")
+    
+    cm.copy(files[:3])
+    if len(cm.items) != 3:
+        pytest.fail("Should replace with 3 items")
+    if cm.operation != "copy":
+        pytest.fail("Should be copy operation")
+    
+    cm.clear()
+    if len(cm.items) != 0:
+        pytest.fail("Should be empty")
 
 
-def test_history_edge_cases():
-    """Test history with various edge cases."""
-    print("\n--- Testing History Edge Cases ---")
+def test_history_redo_stack_clearing():
+    """Recording a new operation after an undo clears the redo stack."""
+    history = OperationHistory()
     
-    try:
-        history = OperationHistory()
-        
-        # Record, undo, then record new operation (should clear redo stack)
-        history.record("op1")
-        history.record("op2")
+    history.record("op1")
+    history.record("op2")
+    history.undo()
+    if not history.can_redo():
+        pytest.fail("Should be able to redo")
+    
+    history.record("op3")
+    if history.can_redo():
+        pytest.fail("Redo stack should be cleared")
+
+
+def test_history_multiple_undo_redo_cycles():
+    """Every recorded operation can be undone and then redone."""
+    history = OperationHistory()
+    for i in range(5):
+        history.record(f"op{i}")
+    
+    # Undo all
+    for i in range(5):
+        if not history.can_undo():
+            pytest.fail(f"Should be able to undo {i}")
         history.undo()
-        assert history.can_redo(), "Should be able to redo"
-        
-        history.record("op3")
-        assert not history.can_redo(), "Redo stack should be cleared"
-        
-        results.add_pass("History redo stack clearing")
-        
-        # Test multiple undo/redo cycles
-        history = OperationHistory()
-        for i in range(5):
-            history.record(f"op{i}")
-        
-        # Undo all
-        for i in range(5):
-            assert history.can_undo(), f"Should be able to undo {i}"
-            history.undo()
-        
-        # Redo all
-        for i in range(5):
-            assert history.can_redo(), f"Should be able to redo {i}"
-            history.redo()
-        
-        results.add_pass("History multiple undo/redo cycles")
-        
-    except Exception as e:
-        results.add_error("History edge cases", e)
-
-
-def test_mixed_file_directory_operations():
+    
+    # Redo all
+    for i in range(5):
+        if not history.can_redo():
+            pytest.fail(f"Should be able to redo {i}")
+        history.redo()
+
+
+def test_mixed_file_directory_operations(work_dir, dest_dir):
     """Test operations with mixed files and directories."""
-    print("\n--- Testing Mixed File/Directory Operations ---")
+    # Create mixed content
+    file1 = os.path.join(work_dir, "file1.txt")
+    with open(file1, 'w') as f:
+        f.write("File 1")
     
-    test_dir = tempfile.mkdtemp(prefix="explorer_mixed_")
+    dir1 = os.path.join(work_dir, "dir1")
+    os.mkdir(dir1)
+    with open(os.path.join(dir1, "nested.txt"), 'w') as f:
+        f.write("Nested file")
     
-    try:
-        # Create mixed content
-        file1 = os.path.join(test_dir, "file1.txt")
-        with open(file1, 'w') as f:
-            f.write("File 1")
-        
-        dir1 = os.path.join(test_dir, "dir1")
-        os.makedirs(dir1)
-        with open(os.path.join(dir1, "nested.txt"), 'w') as f:
-            f.write("Nested file")
-        
-        file2 = os.path.join(test_dir, "file2.txt")
-        with open(file2, 'w') as f:
-            f.write("File 2")
-        
-        # Copy mixed items
-        cm = ClipboardManager()
-        cm.copy([file1, dir1, file2])
-        
-        dest_dir = os.path.join(test_dir, "dest")
-        os.makedirs(dest_dir)
-        
-        result = cm.paste(dest_dir)
-        
-        if (len(result) == 3 and
+    file2 = os.path.join(work_dir, "file2.txt")
+    with open(file2, 'w') as f:
+        f.write("File 2")
+    
+    # Copy mixed items
+    cm = _CM
+    cm.clear()
+    cm.copy([file1, dir1, file2])
+    
+    result = cm.paste(dest_dir)
+    
+    if not (len(result) == 3 and
             os.path.isfile(os.path.join(dest_dir, "file1.txt")) and
             os.path.isdir(os.path.join(dest_dir, "dir1")) and
             os.path.isfile(os.path.join(dest_dir, "file2.txt"))):
-            results.add_pass("Mixed file/directory copy")
-        else:
-            results.add_fail("Mixed file/directory copy", "Not all items copied correctly")
-        
-    except Exception as e:
-        results.add_error("Mixed file/directory operations", e)
-    finally:
-        shutil.rmtree(test_dir, ignore_errors=True)
+        pytest.fail("Not all items copied correctly")
 
 
 def test_clipboard_state_consistency():
     """Test clipboard state remains consistent."""
-    print("\n--- Testing Clipboard State Consistency ---")
+    cm = ClipboardManager()
     
-    try:
-        cm = ClipboardManager()
-        
-        # Initial state
-        assert not cm.has_items()
-        assert cm.operation == ""
-        assert len(cm.items) == 0
-        
-        # After copy
-        cm.copy(["/tmp/test"])
-        assert cm.has_items()
-        assert cm.operation == "copy"
-        assert len(cm.items) == 1
-        
-        # After cut
-        cm.cut(["/tmp/test1", "/tmp/test2"])
-        assert cm.has_items()
-        assert cm.operation == "cut"
-        assert len(cm.items) == 2
-        
-        # After clear
-        cm.clear()
-        assert not cm.has_items()
-        assert cm.operation == ""
-        assert len(cm.items) == 0
-        
-        results.add_pass("Clipboard state consistency")
-        
-    except Exception as e:
-        results.add_error("Clipboard state consistency", e)
-
-
-def run_all_integration_tests():
-    """Run all integration tests."""
-    print("="*60)
-    print("Terminal Explorer - Integration Test Suite")
-    print("="*60)
-    
-    test_special_characters_in_filenames()
-    test_very_long_paths()
-    test_unicode_filenames()
-    test_empty_directory_operations()
-    test_nested_directory_operations()
-    test_large_file_operations()
-    test_readonly_scenarios()
-    test_concurrent_operations()
-    test_history_edge_cases()
-    test_mixed_file_directory_operations()
-    test_clipboard_state_consistency()
-    
-    success = results.summary()
-    
-    print("\n" + "="*60)
-    if success:
-        print("All integration tests passed! ✓")
-        print("="*60)
-        return 0
-    else:
-        print("Some integration tests failed. See details above.")
-        print("="*60)
-        return 1
+    # Initial state
+    if cm.has_items():
+        pytest.fail("Should have no items")
+    if cm.operation != "":
+        pytest.fail("Should have no operation")
+    if len(cm.items) != 0:
+        pytest.fail("Should have 0 items")
+    
+    # After copy
+    cm.copy(["/tmp/test"])
+    if not cm.has_items():
+        pytest.fail("Should have items")
+    if cm.operation != "copy":
+        pytest.fail("Should be copy operation")
+    if len(cm.items) != 1:
+        pytest.fail("Should have 1 item")
+    
+    # After cut
+    cm.cut(["/tmp/test1", "/tmp/test2"])
+    if not cm.has_items():
+        pytest.fail("Should have items")
+    if cm.operation != "cut":
+        pytest.fail("Should be cut operation")
+    if len(cm.items) != 2:
+        pytest.fail("Should have 2 items")
+    
+    # After clear
+    cm.clear()
+    if cm.has_items():
+        pytest.fail("Should have no items")
+    if cm.operation != "":
+        pytest.fail("Should have no operation")
+    if len(cm.items) != 0:
+        pytest.fail("Should have 0 items")
 
 
 if __name__ == "__main__":
-    sys.exit(run_all_integration_tests())
+    sys.exit(pytest.main([__file__, *sys.argv[1:]]))
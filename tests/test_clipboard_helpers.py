@@ -1,6 +1,12 @@
+import errno
 import os
 import shutil
+import stat
+import subprocess
 
+import pytest
+
+import clipboard_helpers
 from clipboard_helpers import ClipboardManager, OperationHistory
 
 
@@ -76,6 +82,13 @@ def test_clipboard_name_conflict(tmp_path):
     assert copied.read_text(encoding="utf-8") == "new"
 
 
+def test_next_free_name_returns_first_gap():
+    existing = {"a.txt", "a (1).txt", "a (2).txt"} | {f"a ({n}).txt" for n in range(4, 9)}
+
+    assert clipboard_helpers._next_free_name("a.txt", existing) == "a (3).txt"
+    assert clipboard_helpers._next_free_name("b.txt", existing) == "b (1).txt"
+
+
 def test_clipboard_copy_directory(tmp_path):
     source = tmp_path / "folder"
     source.mkdir()
@@ -146,3 +159,199 @@ def test_operation_history_max_size_and_redo_clear():
     history.record("four")
     assert not history.can_redo()
     assert [op["op"] for op in history.undo_stack] == ["two", "four"]
+
+
+def test_clipboard_name_conflict_skips_existing_copies(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("new", encoding="utf-8")
+    destination = tmp_path / "destination"
+    destination.mkdir()
+    (destination / "source.txt").write_text("existing", encoding="utf-8")
+    for counter in range(1, 12):
+        (destination / f"source ({counter}).txt").write_text("existing", encoding="utf-8")
+
+    clipboard = ClipboardManager()
+    clipboard.copy([str(source)])
+
+    results = clipboard.paste(str(destination))
+
+    copied = destination / "source (12).txt"
+    assert results == [(str(source), str(copied))]
+    assert copied.read_text(encoding="utf-8") == "new"
+
+
+def test_clipboard_link_copies_on_same_filesystem(tmp_path):
+    source = tmp_path / "folder"
+    source.mkdir()
+    (source / "file.txt").write_text("nested", encoding="utf-8")
+    destination = tmp_path / "destination"
+    destination.mkdir()
+
+    clipboard = ClipboardManager(link_copies=True)
+    clipboard.copy([str(source)])
+
+    results = clipboard.paste(str(destination))
+
+    copied = destination / "folder" / "file.txt"
+    assert results == [(str(source), str(destination / "folder"))]
+    assert copied.read_text(encoding="utf-8") == "nested"
+    assert os.path.samefile(copied, source / "file.txt")
+
+
+def test_clipboard_copy_without_metadata(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("hello", encoding="utf-8")
+    os.utime(source, (0, 0))
+    destination = tmp_path / "destination"
+    destination.mkdir()
+
+    clipboard = ClipboardManager(preserve_metadata=False)
+    clipboard.copy([str(source)])
+    clipboard.paste(str(destination))
+
+    copied = destination / "source.txt"
+    assert copied.read_text(encoding="utf-8") == "hello"
+    assert copied.stat().st_mtime != 0
+    assert not os.path.samefile(copied, source)
+
+
+def test_clipboard_paste_same_name_twice_gets_unique_names(tmp_path):
+    first = tmp_path / "a" / "note.txt"
+    second = tmp_path / "b" / "note.txt"
+    for path, text in ((first, "first"), (second, "second")):
+        path.parent.mkdir()
+        path.write_text(text, encoding="utf-8")
+    destination = tmp_path / "destination"
+    destination.mkdir()
+
+    clipboard = ClipboardManager()
+    clipboard.copy([str(first), str(second)])
+
+    results = clipboard.paste(str(destination))
+
+    assert [dest for _, dest in results] == [
+        str(destination / "note.txt"),
+        str(destination / "note (1).txt"),
+    ]
+    assert (destination / "note (1).txt").read_text(encoding="utf-8") == "second"
+
+
+def test_clipboard_cut_directory(tmp_path):
+    source = tmp_path / "folder"
+    source.mkdir()
+    (source / "file.txt").write_text("nested", encoding="utf-8")
+    destination = tmp_path / "destination"
+    destination.mkdir()
+
+    clipboard = ClipboardManager()
+    clipboard.cut([str(source)])
+
+    results = clipboard.paste(str(destination))
+
+    moved = destination / "folder"
+    assert results == [(str(source), str(moved))]
+    assert (moved / "file.txt").read_text(encoding="utf-8") == "nested"
+    assert not source.exists()
+
+
+def test_robocopy_failure_exit_code_raises(monkeypatch):
+    monkeypatch.setattr(clipboard_helpers, "_robocopy", lambda: "robocopy")
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda command, **kwargs: subprocess.CompletedProcess(command, 8),
+    )
+
+    with pytest.raises(OSError, match="exit code 8"):
+        clipboard_helpers._robocopy_tree("src", "dst")
+
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda command, **kwargs: subprocess.CompletedProcess(command, 1),
+    )
+    clipboard_helpers._robocopy_tree("src", "dst")
+
+
+def test_stash_and_restore_round_trip(tmp_path):
+    folder = tmp_path / "folder"
+    folder.mkdir()
+    (folder / "inner.txt").write_text("inner", encoding="utf-8")
+    stash_root = tmp_path / "stash"
+    stash_root.mkdir()
+
+    stashed = clipboard_helpers.stash_path(str(folder), str(stash_root))
+    assert not folder.exists()
+    assert os.path.isfile(os.path.join(stashed, "inner.txt"))
+    assert sorted(os.listdir(tmp_path)) == ["stash"]
+
+    clipboard_helpers.restore_path(stashed, str(folder))
+    assert (folder / "inner.txt").read_text(encoding="utf-8") == "inner"
+    assert os.listdir(stash_root) == []
+
+
+def test_stash_refuses_items_on_another_filesystem(tmp_path, monkeypatch):
+    item = tmp_path / "item.txt"
+    item.write_text("original", encoding="utf-8")
+    stash_root = tmp_path / "stash"
+    stash_root.mkdir()
+    real_stat = os.stat
+
+    def stash_on_other_device(path, *args, **kwargs):
+        result = real_stat(path, *args, **kwargs)
+        if os.fspath(path) == str(stash_root):
+            fields = list(result)
+            fields[stat.ST_DEV] += 1
+            return os.stat_result(fields)
+        return result
+
+    monkeypatch.setattr(os, "stat", stash_on_other_device)
+    with pytest.raises(OSError) as excinfo:
+        clipboard_helpers.stash_path(str(item), str(stash_root))
+
+    assert excinfo.value.errno == errno.EXDEV
+    assert item.read_text(encoding="utf-8") == "original"
+    assert os.listdir(stash_root) == []
+
+
+def test_restore_refuses_to_overwrite(tmp_path):
+    item = tmp_path / "item.txt"
+    item.write_text("original", encoding="utf-8")
+    stash_root = tmp_path / "stash"
+    stash_root.mkdir()
+    stashed = clipboard_helpers.stash_path(str(item), str(stash_root))
+    item.write_text("newer", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        clipboard_helpers.restore_path(stashed, str(item))
+    assert item.read_text(encoding="utf-8") == "newer"
+    assert os.path.exists(stashed)
+
+
+def test_clipboard_paste_reports_progress(tmp_path):
+    source_dir = tmp_path / "source"
+    dest_dir = tmp_path / "dest"
+    source_dir.mkdir()
+    dest_dir.mkdir()
+    paths = []
+    for index in range(clipboard_helpers.PASTE_PROGRESS_EVERY * 2 + 1):
+        path = source_dir / f"file{index}.txt"
+        path.write_text("x", encoding="utf-8")
+        paths.append(str(path))
+
+    clipboard = ClipboardManager()
+    clipboard.copy(paths)
+    calls = []
+    results = clipboard.paste(str(dest_dir), progress=lambda done, total: calls.append((done, total)))
+
+    assert len(results) == len(paths)
+    every = clipboard_helpers.PASTE_PROGRESS_EVERY
+    assert calls == [(every, len(paths)), (every * 2, len(paths))]
+
+
+def test_clipboard_collapses_duplicate_paths():
+    clipboard = ClipboardManager()
+
+    clipboard.copy(["/tmp/a.txt", "/tmp/b.txt", "/tmp/a.txt"])
+
+    assert clipboard.items == ["/tmp/a.txt", "/tmp/b.txt"]
@@ -1,3 +1,5 @@
+import asyncio
+import datetime
 import os
 import sys
 
@@ -85,3 +87,174 @@ def test_bindings_include_recent_navigation_shortcuts():
     assert "refresh" in actions
     assert "back" in actions
     assert "forward" in actions
+
+
+def test_format_mtime_matches_strftime_and_caches():
+    timestamp = 1_700_000_123.75
+    expected = datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+    assert explorer.format_mtime(timestamp) == expected
+    assert explorer.format_mtime(timestamp + 1) is explorer.format_mtime(timestamp)
+
+
+def test_windows_drive_roots_lists_c_drive_first():
+    roots = explorer.windows_drive_roots()
+
+    assert roots[0] == "C:\\"
+    assert len(set(roots)) == len(roots)
+
+
+def test_file_type_for_name_matches_splitext():
+    names = ["a.txt", "archive.tar.gz", ".bashrc", "..foo", "file.", ".a.b", "README", "x.Py"]
+
+    for name in names:
+        expected = os.path.splitext(name)[1].upper()[1:] or "File"
+        assert explorer.file_type_for_name(name) == expected
+
+
+def test_file_pane_format_size_large_units():
+    pane = explorer.FilePane()
+
+    assert pane.format_size(1024 * 1024 - 1) == "1024.0 KB"
+    assert pane.format_size(3 * 1024**4) == "3.0 TB"
+    assert pane.format_size(2048 * 1024**5) == "2048.0 PB"
+
+
+def test_directory_cache_evicts_least_recently_used(monkeypatch):
+    cache = explorer.OrderedDict()
+    monkeypatch.setattr(explorer, "_dir_cache", cache)
+    pane = explorer.FilePane()
+
+    for index in range(explorer._DIR_CACHE_LIMIT + 1):
+        pane._cache_rows((f"/dir{index}", False), index, [])
+
+    assert len(cache) == explorer._DIR_CACHE_LIMIT
+    assert ("/dir0", False) not in cache
+    assert next(reversed(cache)) == (f"/dir{explorer._DIR_CACHE_LIMIT}", False)
+
+
+def test_forget_listings_drops_parent_directories_of_history_paths(monkeypatch):
+    cache = explorer.OrderedDict()
+    monkeypatch.setattr(explorer, "_dir_cache", cache)
+    for key in [("/dest", False), ("/dest", True), ("/src", False), ("/other", False)]:
+        cache[key] = (0, [])
+    op = {"op": "paste", "items": [("/src/a.txt", "/dest/a.txt")], "destination": "/dest"}
+
+    explorer.forget_listings(explorer.operation_paths(op))
+    explorer.forget_listings(explorer.operation_paths({"op": "rename", "old_path": "/src/b", "new_path": "/src/c"}))
+
+    assert list(cache) == [("/other", False)]
+
+
+def test_new_file_relists_when_directory_mtime_does_not_change(tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    pinned = os.stat(tmp_path).st_mtime_ns
+    real_stat = os.stat
+
+    def coarse_stat(path, *args, **kwargs):
+        # A coarse-timestamp filesystem: the folder's mtime never moves
+        result = real_stat(path, *args, **kwargs)
+        if os.fspath(path) == str(tmp_path):
+            times = [result.st_atime, result.st_mtime, result.st_ctime, result.st_atime_ns, pinned, result.st_ctime_ns]
+            return os.stat_result(list(result) + times)
+        return result
+
+    async def scenario():
+        app = explorer.ExplorerApp(str(tmp_path))
+        async with app.run_test() as pilot:
+            pane = app.query_one("#left-pane", explorer.FilePane)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            monkeypatch.setattr(os, "stat", coarse_stat)
+
+            pane.action_new_file()
+            await pilot.pause()
+            await app.screen.dismiss("b.txt")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            return {key.value for key in pane.table.rows}
+
+    rows = asyncio.run(scenario())
+
+    assert str(tmp_path / "b.txt") in rows
+
+
+def test_paste_worker_reports_unexpected_errors(tmp_path):
+    def vanished_destination(destination, progress=None):
+        raise FileNotFoundError(2, "No such file or directory", destination)
+
+    async def scenario():
+        app = explorer.ExplorerApp(str(tmp_path))
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.active_pane = app.query_one("#left-pane", explorer.FilePane)
+            app.file_clipboard.paste = vanished_destination
+
+            app.action_paste_files()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            return app.is_running, [notification.message for notification in app._notifications]
+
+    running, messages = asyncio.run(scenario())
+
+    assert running
+    assert any(message.startswith("Paste failed:") for message in messages)
+
+
+@pytest.mark.skipif(explorer._getdents64() is None, reason="getdents64 is Linux-only")
+def test_fast_scandir_matches_os_scandir(tmp_path):
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "file.txt").write_text("x", encoding="utf-8")
+    (tmp_path / "link").symlink_to(tmp_path / "folder")
+    (tmp_path / "dangling").symlink_to(tmp_path / "missing")
+
+    fast = sorted((entry.name, entry.path, is_dir) for entry, is_dir in explorer._fast_scandir(str(tmp_path)))
+    with os.scandir(tmp_path) as it:
+        expected = sorted((entry.name, entry.path, entry.is_dir()) for entry in it)
+
+    assert fast == expected
+
+    fast_nofollow = sorted(
+        (entry.name, entry.is_dir(follow_symlinks=False)) for entry, _ in explorer._fast_scandir(str(tmp_path))
+    )
+    with os.scandir(tmp_path) as it:
+        expected_nofollow = sorted((entry.name, entry.is_dir(follow_symlinks=False)) for entry in it)
+
+    assert fast_nofollow == expected_nofollow
+
+
+def test_unescape_mount_field_decodes_octal_escapes():
+    assert explorer._unescape_mount_field(r"/mnt/team\040share") == "/mnt/team share"
+    assert explorer._unescape_mount_field("/mnt/plain") == "/mnt/plain"
+
+
+def test_local_temp_directory_is_not_network_path(tmp_path):
+    assert not explorer.is_network_path(str(tmp_path))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="mount table lookup is Linux-only")
+def test_network_path_lookup_uses_cached_mount_table(monkeypatch, tmp_path):
+    share = tmp_path / "share"
+    share.mkdir()
+    table = [(str(share), str(share) + "/", "nfs"), ("/", "/", "ext4")]
+    monkeypatch.setattr(explorer, "_mount_table_cache", (explorer.time.monotonic(), table))
+
+    assert explorer.is_network_path(str(share / "docs"))
+    assert not explorer.is_network_path(str(tmp_path))
+    assert explorer._mount_table() is table
+
+
+def test_favorite_paths_lists_existing_home_folders():
+    favorites = explorer.favorite_paths()
+
+    assert favorites[0] == ("Home", os.path.expanduser("~"), "🏠")
+    assert all(os.path.exists(path) for _, path, _ in favorites)
+    assert explorer.favorite_paths() is favorites
+
+
+def test_app_stylesheet_file_exists():
+    css_file = os.path.join(os.path.dirname(explorer.__file__), explorer.ExplorerApp.CSS_PATH)
+
+    with open(css_file, encoding="utf-8") as handle:
+        css = handle.read()
+    assert "FilePane" in css and "#sidebar" in css
@@ -1,6 +1,126 @@
-from analyze_code import analyze_code
+from analyze_code import SEV_HIGH, _ANALYSIS_CACHE, _cache_key, analyze_code, analyze_files
 
 
 def test_static_analysis_has_no_issues():
     issues = analyze_code("explorer.py") + analyze_code("clipboard_helpers.py")
     assert issues == []
+
+
+def test_static_analysis_reports_each_check(tmp_path):
+    source = tmp_path / "sample.py"
+    source.write_text(
+        "import os\n"
+        "import subprocess\n"
+        "try:\n"
+        "    os.system('ls')\n"
+        "except:\n"
+        "    # ignored\n"
+        "    pass\n"
+        "subprocess.run('ls', shell=True)\n"
+        "path = os.path.join(base, '..')\n",
+        encoding="utf-8",
+    )
+
+    issues = analyze_code(str(source))
+
+    found = [(issue.line, issue.severity, issue.type) for issue in issues]
+    assert found == [
+        (4, 'HIGH', 'Security: os.system usage'),
+        (5, 'MEDIUM', 'Bare except clause'),
+        (7, 'LOW', 'Silent error handling'),
+        (8, 'HIGH', 'Security: shell injection risk'),
+        (9, 'MEDIUM', 'Potential path traversal'),
+    ]
+    assert issues[2].code == "Line 5: except: ... pass"
+
+
+def test_bare_except_detection_matches_whitespace_variants(tmp_path):
+    source = tmp_path / "excepts.py"
+    source.write_text(
+        "except:\n"
+        "    except \t:\n"
+        "x = 'exception'; except:\n"
+        "except Exception:\n"
+        "exceptional = 1\n",
+        encoding="utf-8",
+    )
+
+    issues = analyze_code(str(source))
+
+    bare = [issue.line for issue in issues if issue.type == 'Bare except clause']
+    assert bare == [1, 2, 3]
+
+
+def test_static_analysis_handles_empty_and_crlf_files(tmp_path):
+    empty = tmp_path / "empty.py"
+    empty.write_bytes(b"")
+    crlf = tmp_path / "crlf.py"
+    crlf.write_bytes(b"try:\r\n    run()\r\nexcept:\r\n    pass\r\n")
+
+    assert analyze_code(str(empty)) == []
+    issues = analyze_code(str(crlf))
+    assert [issue.line for issue in issues] == [3, 4]
+    assert issues[0].code == "except:"
+
+
+def test_static_analysis_cache_tracks_file_changes(tmp_path):
+    source = tmp_path / "cached.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    assert analyze_code(str(source)) == []
+    assert analyze_code(str(source)) == []
+
+    source.write_text("import os\nos.system('ls')\n", encoding="utf-8")
+    issues = analyze_code(str(source))
+    assert [issue.type for issue in issues] == ['Security: os.system usage']
+
+    issues.clear()
+    assert len(analyze_code(str(source))) == 1
+
+
+def test_static_analysis_treats_lone_cr_as_a_line_break(tmp_path):
+    source = tmp_path / "cr.py"
+    source.write_bytes(b"try:\r    run()\rexcept:\r    pass\ros.system('ls')\r")
+
+    issues = analyze_code(str(source))
+
+    assert [(issue.line, issue.type) for issue in issues] == [
+        (3, 'Bare except clause'),
+        (4, 'Silent error handling'),
+        (5, 'Security: os.system usage'),
+    ]
+    assert issues[2].code == "os.system('ls')"
+
+
+def test_static_analysis_uses_unicode_word_boundaries_and_whitespace(tmp_path):
+    source = tmp_path / "unicode.py"
+    source.write_text(
+        "éos.system('ls')\n"
+        "try:\n"
+        "    run()\n"
+        "except: \n"
+        "    pass \n",
+        encoding="utf-8",
+    )
+
+    issues = analyze_code(str(source))
+
+    assert [(issue.line, issue.type) for issue in issues] == [
+        (4, 'Bare except clause'),
+        (5, 'Silent error handling'),
+    ]
+    assert issues[0].code == "except:"
+
+
+def test_parallel_analysis_fills_parent_cache_with_interned_issues(tmp_path, monkeypatch):
+    monkeypatch.setattr("analyze_code.PARALLEL_MIN_FILES", 2)
+    paths = []
+    for index in range(2):
+        source = tmp_path / f"parallel{index}.py"
+        source.write_text(f"import os\nos.system('ls {index}')\n", encoding="utf-8")
+        paths.append(str(source))
+
+    per_file = analyze_files(paths)
+
+    assert [[issue.line for issue in issues] for issues in per_file] == [[2], [2]]
+    assert all(issues[0].severity is SEV_HIGH for issues in per_file)
+    assert all(_cache_key(path) in _ANALYSIS_CACHE for path in paths)